@@ -11,30 +11,48 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import pandas as pd
+import importlib.util
+import os
 import numpy as np
 import pickle
+import queue
 import threading
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from operator import itemgetter
 import warnings
 warnings.filterwarnings('ignore')
 
-# Optional matplotlib import
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Heavy modules are only probed here (cheap) and imported when actually
+# used, so `python LSTM.py` reaches the GUI without paying their cold start
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+if not MATPLOTLIB_AVAILABLE:
     print("⚠️  Matplotlib not available - charts disabled")
 
+TENSORFLOW_AVAILABLE = importlib.util.find_spec('tensorflow') is not None
+if not TENSORFLOW_AVAILABLE:
+    print("⚠️  TensorFlow not available - using simulation mode")
+
+# Optional ONNX Runtime import - lighter dispatch than Keras for batch-1 inference
 try:
-    from tensorflow.keras.models import load_model
-    TENSORFLOW_AVAILABLE = True
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
 except ImportError:
-    TENSORFLOW_AVAILABLE = False
-    print("⚠️  TensorFlow not available - using simulation mode")
+    ONNXRUNTIME_AVAILABLE = False
+
+# Numeric core lives in predictor.py - no GUI imports in the prediction
+# call graph, and the Numba kernels there JIT-cache independently of Tk
+from predictor import Predictor, classify_one, STATUS, LEVELS
+
+
+# Label color + emoji per status index returned by classify_one
+_STATUS_STYLES = (('#27ae60', '🟢'), ('#f39c12', '🟡'), ('#e74c3c', '🔴'))
+
+# Separator rules for the analysis log, built once instead of per tick
+_RULE60 = '=' * 60
+_RULE30 = '-' * 30
+_RULE40 = '-' * 40
+
 
 class EnhancedPredictiveMonitor:
     """
@@ -51,18 +69,60 @@ class EnhancedPredictiveMonitor:
         self.model = None
         self.scaler = None
         self.model_loaded = False
+        self._scaler_mean = None
+        self._scaler_scale = None
+
+        # TFLite INT8 interpreter (preferred inference path when available)
+        self.interpreter = None
+        self._input_detail = None
+        self._output_detail = None
+        self._tfl_out_heads = None   # head-name -> output detail for multi-head models
+
+        # Cached tf.function concrete function (skips Model.predict dispatch overhead)
+        self._predict_fn = None
+
+        # SavedModel serving signature - loads without rebuilding Keras objects
+        self._sig = None
+
+        # Optional ONNX Runtime session (fastest path for batch-1 CPU inference)
+        self._ort_session = None
+        self._ort_input_name = None
+        self._ort_output_names = None
         
         # Monitoring state
         self.is_monitoring = False
         self.monitoring_thread = None
         self.recording_start_time = None
         self.data_points_recorded = 0
+
+        # Inference pipeline - the sampler feeds a bounded frame queue, one
+        # persistent worker runs the model for the life of the app, the Tk
+        # main loop drains results. A single worker started here (never per
+        # session) means stop/start can't stack duplicate threads racing
+        # over the shared _scaled/_X buffers and interpreter tensors
+        self._infer_q = queue.Queue(maxsize=2)
+        self._result_q = queue.Queue(maxsize=2)
+        self._infer_thread = threading.Thread(target=self.inference_loop, daemon=True)
+        self._infer_thread.start()
+
+        # Session generation - bumped on every start so a sampler thread
+        # from a previous session exits instead of running alongside the
+        # new one
+        self._run_gen = 0
+
+        # Monotonic clock anchor - ticks store cheap ns offsets, rendering
+        # reconstructs wall-clock time from the anchor only when formatting
+        self._start_ns = time.monotonic_ns()
+        self._start_wall = time.time()
         
-        # Data storage
-        self.sensor_history = []
-        self.prediction_history = []
-        self.timestamps = []
+        # Data storage - bounded ring buffers so long runs never grow memory
         self.sequence_length = 15
+        self.prediction_history = deque(maxlen=self.sequence_length)
+        self.timestamps = deque(maxlen=self.sequence_length)
+        self._seq_buf = np.zeros((self.sequence_length, 6), dtype=np.float32)
+        self._scaled = np.empty_like(self._seq_buf)
+        self._X = self._scaled.reshape(1, self.sequence_length, 6)  # persistent model-input view
+        self._window_count = 0
         
         # Alert management
         self.active_alerts = set()  # Track active alert types
@@ -136,10 +196,34 @@ class EnhancedPredictiveMonitor:
             }
         }
         
+        # Fixed parameter order cached once - per-tick code indexes these
+        self._param_names = tuple(self.parameters.keys())
+        self._param_units = tuple(self.parameters[p]['unit'] for p in self._param_names)
+        self._sliders_in_order = ()
+
+        # Display constants hoisted out of the per-tick render functions
+        self._status_colors = {'HEALTHY': '#27ae60', 'WARNING': '#f39c12', 'CRITICAL': '#e74c3c'}
+        self._status_emojis = {'HEALTHY': '🟢', 'WARNING': '🟡', 'CRITICAL': '🔴'}
+        self._severity_icons = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟠'}
+        self._priority_icons = {'URGENT': '🚨', 'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}
+
+        # Numeric core - classification, simulation, analysis, recommendations
+        self._predictor = Predictor(self.parameters, self.failure_patterns)
+
         # GUI components
         self.sliders = {}
         self.value_labels = {}
         self.status_displays = {}
+
+        # Slider-drag throttling - dirty values batched into one flush
+        self._pending_values = {}
+        self._flush_scheduled = None
+
+        # Analysis log line cap - keeps Text redraw cost flat on long runs
+        self._max_log_lines = 500
+
+        # Process-local RNG - no global legacy-RNG lock between threads
+        self._rng = np.random.default_rng()
         
         # Load model and setup GUI
         self.load_model()
@@ -151,14 +235,67 @@ class EnhancedPredictiveMonitor:
             if TENSORFLOW_AVAILABLE:
                 model_files = ['enhanced_lstm_health_model.h5', 'new_lstm_health_model.h5', 'lstm_health_model.h5']
                 scaler_files = ['enhanced_scaler.pkl', 'new_scaler.pkl', 'scaler.pkl']
-                
+
+                # Prefer a cached .onnx, then FP16 .tflite - both load without rebuilding Keras objects
+                if ONNXRUNTIME_AVAILABLE:
+                    for model_file, scaler_file in zip(model_files, scaler_files):
+                        onnx_file = model_file.replace('.h5', '.onnx')
+                        npz_file = scaler_file.replace('.pkl', '.npz')
+                        if os.path.exists(onnx_file) and (os.path.exists(npz_file) or os.path.exists(scaler_file)):
+                            try:
+                                self._load_scaler(scaler_file)
+                                self._load_ort(onnx_file)
+                                self.model_loaded = True
+                                print(f"✅ Successfully loaded {onnx_file} and {scaler_file}")
+                                return
+                            except Exception as e:
+                                print(f"⚠️  Could not load {onnx_file}: {e}")
+                                self._ort_session = None
+
+                for model_file, scaler_file in zip(model_files, scaler_files):
+                    fp16_file = model_file.replace('.h5', '_fp16.tflite')
+                    npz_file = scaler_file.replace('.pkl', '.npz')
+                    if os.path.exists(fp16_file) and (os.path.exists(npz_file) or os.path.exists(scaler_file)):
+                        try:
+                            self._load_scaler(scaler_file)
+                            self._load_interpreter(fp16_file)
+                            self.model_loaded = True
+                            print(f"✅ Successfully loaded {fp16_file} and {scaler_file}")
+                            return
+                        except Exception as e:
+                            print(f"⚠️  Could not load {fp16_file}: {e}")
+                            self.interpreter = None
+
+                # Cached SavedModel loads a serving signature without
+                # reconstructing Keras layer objects
+                for model_file, scaler_file in zip(model_files, scaler_files):
+                    saved_dir = model_file.replace('.h5', '_savedmodel')
+                    npz_file = scaler_file.replace('.pkl', '.npz')
+                    if os.path.isdir(saved_dir) and (os.path.exists(npz_file) or os.path.exists(scaler_file)):
+                        try:
+                            self._load_scaler(scaler_file)
+                            self._load_saved_model(saved_dir)
+                            self.model_loaded = True
+                            print(f"✅ Successfully loaded {saved_dir} and {scaler_file}")
+                            return
+                        except Exception as e:
+                            print(f"⚠️  Could not load {saved_dir}: {e}")
+                            self._sig = None
+
+                # Deferred import - only pay the TF cold start when a cached
+                # accelerated model isn't available
+                from tensorflow.keras.models import load_model as load_keras_model
+
                 for model_file, scaler_file in zip(model_files, scaler_files):
                     try:
-                        self.model = load_model(model_file)
-                        with open(scaler_file, 'rb') as f:
-                            self.scaler = pickle.load(f)
+                        self.model = load_keras_model(model_file)
+                        self._load_scaler(scaler_file)
                         self.model_loaded = True
                         print(f"✅ Successfully loaded {model_file} and {scaler_file}")
+                        self._init_onnx(model_file)
+                        self._init_tflite(model_file)
+                        self._init_predict_fn()
+                        self._export_saved_model(model_file)
                         break
                     except Exception as e:
                         print(f"⚠️  Could not load {model_file}: {e}")
@@ -171,7 +308,204 @@ class EnhancedPredictiveMonitor:
         except Exception as e:
             print(f"❌ Error loading model: {e}")
             self.model_loaded = False
-    
+
+    def _cache_scaler_params(self):
+        """Cache the scaler's mean/scale arrays so the hot path skips sklearn's validation overhead"""
+        try:
+            self._scaler_mean = self.scaler.mean_.astype(np.float32)
+            self._scaler_scale = self.scaler.scale_.astype(np.float32)
+        except AttributeError:
+            self._scaler_mean = None
+            self._scaler_scale = None
+
+    def _load_scaler(self, scaler_file):
+        """Load scaler params - flat .npz preferred so pickle/sklearn stay off the load path"""
+        npz_file = scaler_file.replace('.pkl', '.npz')
+        if os.path.exists(npz_file):
+            data = np.load(npz_file)
+            self._scaler_mean = data['mean']
+            self._scaler_scale = data['scale']
+            return
+        with open(scaler_file, 'rb') as f:
+            self.scaler = pickle.load(f)
+        self._cache_scaler_params()
+        if self._scaler_mean is not None:
+            np.savez(npz_file, mean=self._scaler_mean, scale=self._scaler_scale)
+            print(f"✅ Cached scaler params as {npz_file}")
+
+    def _representative_dataset(self):
+        """Yield ~100 scaled sequences spanning the configured sensor ranges for INT8 calibration"""
+        lows = np.array([c['min'] for c in self.parameters.values()], dtype=np.float32)
+        highs = np.array([c['max'] for c in self.parameters.values()], dtype=np.float32)
+        for _ in range(100):
+            seq = self._rng.uniform(lows, highs, size=(self.sequence_length, 6))
+            if self._scaler_mean is not None:
+                scaled = ((seq - self._scaler_mean) / self._scaler_scale).astype(np.float32)
+            else:
+                scaled = self.scaler.transform(seq).astype(np.float32)
+            yield [scaled.reshape(1, self.sequence_length, 6)]
+
+    def _init_tflite(self, model_file):
+        """Convert the Keras model to TFLite (INT8 preferred, FP16 fallback) and cache it beside the .h5"""
+        try:
+            import tensorflow as tf
+
+            int8_file = model_file.replace('.h5', '_int8.tflite')
+            fp16_file = model_file.replace('.h5', '_fp16.tflite')
+
+            if os.path.exists(int8_file):
+                self._load_interpreter(int8_file)
+                return
+            if os.path.exists(fp16_file):
+                self._load_interpreter(fp16_file)
+                return
+
+            try:
+                converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+                converter.representative_dataset = self._representative_dataset
+                converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+                converter.inference_input_type = tf.int8
+                converter.inference_output_type = tf.int8
+                with open(int8_file, 'wb') as f:
+                    f.write(converter.convert())
+                print(f"✅ Cached INT8 TFLite model as {int8_file}")
+                self._load_interpreter(int8_file)
+            except Exception as e:
+                # FP16 post-training quantization: half the size, float32 I/O
+                print(f"⚠️  INT8 conversion failed ({e}), trying FP16...")
+                converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+                converter.target_spec.supported_types = [tf.float16]
+                with open(fp16_file, 'wb') as f:
+                    f.write(converter.convert())
+                print(f"✅ Cached FP16 TFLite model as {fp16_file}")
+                self._load_interpreter(fp16_file)
+        except Exception as e:
+            self.interpreter = None
+            print(f"⚠️  TFLite unavailable, using Keras predict: {e}")
+
+    def _export_saved_model(self, model_file):
+        """Cache a SavedModel export so later launches skip the Keras rebuild"""
+        saved_dir = model_file.replace('.h5', '_savedmodel')
+        if os.path.isdir(saved_dir):
+            return
+        try:
+            self.model.save(saved_dir, save_format='tf')
+            print(f"✅ Cached SavedModel as {saved_dir}")
+        except Exception as e:
+            print(f"⚠️  Could not export SavedModel: {e}")
+
+    def _load_saved_model(self, saved_dir):
+        """Load the serving signature from a cached SavedModel directory"""
+        import tensorflow as tf
+
+        self._sig = tf.saved_model.load(saved_dir).signatures['serving_default']
+        print(f"✅ Using SavedModel signature ({saved_dir}) for inference")
+
+    def _init_onnx(self, model_file):
+        """Export the Keras model to ONNX (cached beside the .h5) and open an ORT session"""
+        if not ONNXRUNTIME_AVAILABLE:
+            return
+        try:
+            onnx_file = model_file.replace('.h5', '.onnx')
+            if not os.path.exists(onnx_file):
+                import tensorflow as tf
+                import tf2onnx
+
+                tf2onnx.convert.from_keras(
+                    self.model,
+                    input_signature=[tf.TensorSpec((1, self.sequence_length, 6), tf.float32)],
+                    output_path=onnx_file
+                )
+                print(f"✅ Cached ONNX model as {onnx_file}")
+            self._load_ort(onnx_file)
+        except Exception as e:
+            self._ort_session = None
+            print(f"⚠️  ONNX export unavailable, using TFLite/Keras: {e}")
+
+    def _load_ort(self, onnx_file):
+        """Open a cached .onnx model with the CPU execution provider, all graph optimizations on"""
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.intra_op_num_threads = os.cpu_count()
+        sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._ort_session = onnxruntime.InferenceSession(
+            onnx_file, sess_options, providers=['CPUExecutionProvider']
+        )
+        self._ort_input_name = self._ort_session.get_inputs()[0].name
+        # The ONNX graph may rename the Keras heads, but predict_health
+        # looks results up by head name - normalize each output to its head
+        # here, by name substring first, then by output width; refuse the
+        # session loudly rather than let every tick fall back to _simulate()
+        ort_outputs = self._ort_session.get_outputs()
+        if len(ort_outputs) > 1:
+            widths = {'health_classification': 3,
+                      'failure_prediction': 6,
+                      'time_to_failure': 1}
+            names = []
+            for o in ort_outputs:
+                head = next((h for h in widths if h in o.name), None)
+                if head is None:
+                    last = o.shape[-1] if o.shape else None
+                    head = next((h for h, w in widths.items()
+                                 if w == last and h not in names), None)
+                if head is None or head in names:
+                    raise RuntimeError(
+                        f"cannot map ONNX output {o.name!r} to a model head")
+                names.append(head)
+            self._ort_output_names = names
+        else:
+            self._ort_output_names = [o.name for o in ort_outputs]
+        print(f"✅ Using ONNX Runtime ({onnx_file}) for inference")
+
+    def _load_interpreter(self, tflite_file):
+        """Load a cached .tflite model into a ready-to-invoke interpreter"""
+        import tensorflow as tf
+
+        self.interpreter = tf.lite.Interpreter(model_path=tflite_file, num_threads=os.cpu_count())
+        self.interpreter.allocate_tensors()
+        self._input_detail = self.interpreter.get_input_details()[0]
+        out_details = self.interpreter.get_output_details()
+        self._output_detail = out_details[0]
+        # Multi-head outputs come back in no guaranteed order - resolve each
+        # detail to its Keras head by tensor name, then by output width,
+        # and refuse the interpreter rather than risk crossed outputs
+        # (same guard as the ONNX path above)
+        self._tfl_out_heads = None
+        if len(out_details) > 1:
+            widths = {'health_classification': 3,
+                      'failure_prediction': 6,
+                      'time_to_failure': 1}
+            mapping = {}
+            for out in out_details:
+                head = next((h for h in widths if h in out['name']), None)
+                if head is None:
+                    head = next((h for h, w in widths.items()
+                                 if w == out['shape'][-1] and h not in mapping),
+                                None)
+                if head is None or head in mapping:
+                    raise RuntimeError(
+                        f"cannot map TFLite output {out['name']!r} to a model head")
+                mapping[head] = out
+            if 'health_classification' not in mapping:
+                raise RuntimeError("TFLite outputs lack a health head")
+            self._tfl_out_heads = mapping
+        print(f"✅ Using TFLite interpreter ({tflite_file}) for inference")
+
+    def _init_predict_fn(self):
+        """Build a concrete tf.function for single-sample inference (no retracing per call)"""
+        try:
+            import tensorflow as tf
+
+            self._predict_fn = tf.function(
+                lambda x: self.model(x, training=False),
+                input_signature=[tf.TensorSpec((1, self.sequence_length, 6), tf.float32)]
+            ).get_concrete_function()
+            print("✅ Cached concrete tf.function for inference")
+        except Exception as e:
+            self._predict_fn = None
+            print(f"⚠️  Could not build concrete predict function: {e}")
+
     def setup_gui(self):
         """Setup the enhanced GUI interface"""
         # Main title
@@ -290,22 +624,14 @@ class EnhancedPredictiveMonitor:
         canvas.pack(side="left", fill="both", expand=True)
         slider_scrollbar.pack(side="right", fill="y")
         
-        # Enhanced mousewheel binding - only when mouse is over the canvas area
+        # Wheel events bound straight on the canvas - Tk only delivers them to
+        # the widget under the pointer, so no winfo_containing round-trip and
+        # no enter/leave bind_all juggling is needed
         def _on_mousewheel(event):
-            if canvas.winfo_containing(event.x_root, event.y_root) == canvas:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_mousewheel(event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
-        def _unbind_mousewheel(event):
-            canvas.unbind_all("<MouseWheel>")
-        
-        # Bind mouse wheel only when hovering over the scrollable area
-        canvas.bind('<Enter>', _bind_mousewheel)
-        canvas.bind('<Leave>', _unbind_mousewheel)
-        scrollable_frame.bind('<Enter>', _bind_mousewheel)
-        scrollable_frame.bind('<Leave>', _unbind_mousewheel)
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+        canvas.bind("<MouseWheel>", _on_mousewheel)
+        scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
         
         # Configure canvas resize behavior
         def configure_canvas(event):
@@ -352,7 +678,7 @@ class EnhancedPredictiveMonitor:
                 param_container, from_=config['min'], to=config['max'],
                 orient='horizontal', resolution=0.1 if config['max'] < 100 else 1,
                 length=320, bg='#ecf0f1', fg='#2c3e50',
-                command=lambda val, name=param_name: self.update_value_label(name, val)
+                command=lambda val, name=param_name: self.queue_value_update(name, val)
             )
             slider.set(config['default'])
             slider.pack(padx=10, pady=(0, 5))
@@ -365,6 +691,9 @@ class EnhancedPredictiveMonitor:
                 param_container, text=range_text, font=('Arial', 8),
                 bg='#ecf0f1', fg='#27ae60'
             )
+        # Sliders in fixed parameter order so get_current_values skips dict lookups
+        self._sliders_in_order = tuple(self.sliders[p] for p in self._param_names)
+
         # Add scroll indicator at bottom of sensor controls
         scroll_indicator = tk.Label(
             parent, 
@@ -607,49 +936,129 @@ class EnhancedPredictiveMonitor:
         )
         maint_scroll_hint.pack(pady=(0, 5))
     
+    def queue_value_update(self, param_name, value):
+        """Coalesce slider drags - one flush per 50ms instead of one per pixel"""
+        self._pending_values[param_name] = value
+        if self._flush_scheduled is None:
+            self._flush_scheduled = self.root.after(50, self._flush_pending)
+
+    def _flush_pending(self):
+        """Apply every dirty slider value in one batch on the main thread"""
+        self._flush_scheduled = None
+        pending, self._pending_values = self._pending_values, {}
+        for param_name, value in pending.items():
+            self.update_value_label(param_name, value)
+
     def update_value_label(self, param_name, value):
         """Update parameter value label with color coding"""
         config = self.parameters[param_name]
         pattern = self.failure_patterns[param_name]
         
-        self.value_labels[param_name].config(text=f"{float(value):.1f} {config['unit']}")
-        
-        # Color coding and status indicator
+        # Color coding and status indicator via the compiled scalar kernel -
+        # one configure per widget keeps Tk command dispatch to two calls
         val = float(value)
-        if pattern['optimal_low'] <= val <= pattern['optimal_high']:
-            # Optimal
-            self.value_labels[param_name].config(fg='#27ae60')
-            self.status_displays[param_name].config(text="🟢", fg='#27ae60')
-        elif pattern['warning_low'] <= val <= pattern['warning_high']:
-            # Warning 
-            self.value_labels[param_name].config(fg='#f39c12')
-            self.status_displays[param_name].config(text="🟡", fg='#f39c12')
-        else:
-            # Critical
-            self.value_labels[param_name].config(fg='#e74c3c')
-            self.status_displays[param_name].config(text="🔴", fg='#e74c3c')
+        status = classify_one(
+            val, pattern['optimal_low'], pattern['optimal_high'],
+            pattern['warning_low'], pattern['warning_high']
+        )
+        color, emoji = _STATUS_STYLES[status]
+        self.value_labels[param_name].configure(text=f"{val:.1f} {config['unit']}", fg=color)
+        self.status_displays[param_name].configure(text=emoji, fg=color)
     
     def get_current_values(self):
         """Get current slider values"""
-        return [self.sliders[param].get() for param in self.parameters.keys()]
-    
-    def predict_health(self, sensor_data):
-        """Enhanced health prediction with failure analysis"""
+        return [s.get() for s in self._sliders_in_order]
+
+    def _trim_log(self, widget):
+        """Drop the oldest lines once a Text widget exceeds the log cap"""
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count > self._max_log_lines:
+            widget.delete('1.0', f'{line_count - self._max_log_lines}.0')
+
+    def _format_ts(self, t_ns, fmt):
+        """Turn a monotonic ns offset back into wall-clock text (render time only)"""
+        return time.strftime(fmt, time.localtime(self._start_wall + t_ns / 1e9))
+
+    def push_sample(self, values):
+        """Shift the rolling window up one row and write the newest sample"""
+        self._seq_buf[:-1] = self._seq_buf[1:]
+        self._seq_buf[-1] = values
+        if self._window_count < self.sequence_length:
+            self._window_count += 1
+
+    def predict_health(self, window):
+        """Enhanced health prediction with failure analysis on a window snapshot"""
         try:
-            if not self.model_loaded or len(sensor_data) < self.sequence_length:
-                return self.simulate_prediction(sensor_data)
-            
-            # Prepare data for LSTM
-            recent_data = np.array(sensor_data[-self.sequence_length:])
-            
-            # Scale the data
-            scaled_data = self.scaler.transform(recent_data)
-            
-            # Reshape for LSTM
-            X = scaled_data.reshape(1, self.sequence_length, 6)
-            
-            # Make prediction
-            predictions = self.model.predict(X, verbose=0)
+            if not self.model_loaded or self._window_count < self.sequence_length:
+                return self._simulate(window)
+
+            # The snapshot holds the last sequence_length samples; the live
+            # ring keeps shifting under the sampler thread while we run
+            recent_data = window
+
+            # Scale in place - inline (x - mean) / scale beats scaler.transform's validation
+            if self._scaler_mean is not None:
+                np.subtract(recent_data, self._scaler_mean, out=self._scaled)
+                np.divide(self._scaled, self._scaler_scale, out=self._scaled)
+            else:
+                self._scaled[:] = self.scaler.transform(recent_data)
+
+            # _X is a persistent (1,15,6) view over the scaled buffer - no reshape alloc
+            X = self._X
+
+            # Make prediction - ONNX Runtime first, then quantized TFLite interpreter
+            if self._ort_session is not None:
+                outputs = self._ort_session.run(None, {self._ort_input_name: X})
+                if len(outputs) > 1:
+                    predictions = dict(zip(self._ort_output_names, outputs))
+                else:
+                    predictions = outputs[0]
+            elif self.interpreter is not None:
+                in_scale, in_zero = self._input_detail['quantization']
+                if in_scale:  # quantized input (INT8)
+                    # Clip before the cast - values past the representative
+                    # range would otherwise wrap around on int8 conversion
+                    quantized = np.clip(np.round(X / in_scale + in_zero),
+                                        -128, 127).astype(self._input_detail['dtype'])
+                    self.interpreter.set_tensor(self._input_detail['index'], quantized)
+                else:  # float input - write straight into the interpreter's tensor
+                    self.interpreter.tensor(self._input_detail['index'])()[:] = X
+                self.interpreter.invoke()
+                if self._tfl_out_heads is not None:
+                    # Multi-head model - read each tensor through the head
+                    # map built at load time, never positionally
+                    predictions = {}
+                    for head, out in self._tfl_out_heads.items():
+                        raw = self.interpreter.get_tensor(out['index'])
+                        out_scale, out_zero = out['quantization']
+                        if out_scale:
+                            raw = (raw.astype(np.float32) - out_zero) * out_scale
+                        else:
+                            raw = raw.astype(np.float32)
+                        predictions[head] = raw
+                else:
+                    raw = self.interpreter.get_tensor(self._output_detail['index'])
+                    out_scale, out_zero = self._output_detail['quantization']
+                    if out_scale:
+                        predictions = (raw.astype(np.float32) - out_zero) * out_scale
+                    else:
+                        predictions = raw.astype(np.float32)
+            elif self._sig is not None:
+                import tensorflow as tf
+                outputs = self._sig(tf.convert_to_tensor(X, dtype=tf.float32))
+                if len(outputs) > 1:
+                    predictions = {k: v.numpy() for k, v in outputs.items()}
+                else:
+                    predictions = next(iter(outputs.values())).numpy()
+            elif self._predict_fn is not None:
+                import tensorflow as tf
+                predictions = self._predict_fn(tf.convert_to_tensor(X, dtype=tf.float32))
+                if isinstance(predictions, dict):
+                    predictions = {k: v.numpy() for k, v in predictions.items()}
+                else:
+                    predictions = predictions.numpy()
+            else:
+                predictions = self.model.predict(X, verbose=0)
             
             # Extract predictions
             if isinstance(predictions, dict):
@@ -660,229 +1069,43 @@ class EnhancedPredictiveMonitor:
             else:
                 # Simple model - simulate enhanced predictions
                 health_pred = predictions[0]
-                failure_pred = np.random.random(6) > 0.7  # Simulate failure predictions
-                ttf_pred = np.random.uniform(10, 100)  # Simulate time to failure
+                failure_pred = (self._rng.random(6) > 0.7).astype(np.float32)  # Simulate failure predictions
+                ttf_pred = self._rng.uniform(10, 100)  # Simulate time to failure
             
             # Health classification
             health_class = np.argmax(health_pred)
             confidence = np.max(health_pred)
             
-            status_map = {0: "HEALTHY", 1: "WARNING", 2: "CRITICAL"}
-            predicted_status = status_map[health_class]
+            predicted_status = STATUS[health_class]
             
             return {
                 'predicted_status': predicted_status,
                 'predicted_class': health_class,
                 'confidence': confidence,
                 'health_probabilities': health_pred.tolist(),
-                'failure_predictions': failure_pred.tolist(),
+                'failure_predictions': np.asarray(failure_pred, dtype=np.float32),
                 'time_to_failure': max(1, ttf_pred),  # Ensure positive
-                'timestamp': datetime.now(),
+                'timestamp': time.monotonic_ns() - self._start_ns,
                 'model_type': 'Enhanced LSTM'
             }
             
         except Exception as e:
             print(f"Prediction error: {e}")
-            return self.simulate_prediction(sensor_data)
-    
-    def simulate_prediction(self, sensor_data):
-        """Simulate enhanced prediction when model unavailable"""
-        if not sensor_data:
+            return self._simulate(window)
+
+    def _simulate(self, window):
+        """Simulated prediction from the newest window row when no model is loaded"""
+        if self._window_count == 0:
             return None
-        
-        current_values = sensor_data[-1] if len(sensor_data) > 0 else [28, 65, 120, 2200, 15, 225]
-        param_names = list(self.parameters.keys())
-        
-        issues = []
-        failure_predictions = []
-        critical_params = 0
-        warning_params = 0
-        
-        for i, value in enumerate(current_values):
-            param_name = param_names[i]
-            pattern = self.failure_patterns[param_name]
-            
-            if value <= pattern['critical_low'] or value >= pattern['critical_high']:
-                # Critical range - high failure probability
-                issues.append(param_name)
-                failure_predictions.append(0.9)
-                critical_params += 1
-            elif value <= pattern['warning_low'] or value >= pattern['warning_high']:
-                # Warning range - medium failure probability  
-                failure_predictions.append(0.6)
-                warning_params += 1
-                if param_name not in issues:
-                    issues.append(param_name)
-            elif pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                # Optimal range - low failure probability
-                failure_predictions.append(0.05)
-            else:
-                # Between optimal and warning - slightly elevated risk
-                failure_predictions.append(0.2)
-        
-        # Determine overall health status based on parameter conditions
-        if critical_params > 0:
-            # Any critical parameter makes the system critical
-            status = "CRITICAL"
-            health_class = 2
-            confidence = 0.85 + (critical_params * 0.05)  # Higher confidence with more critical params
-            ttf = np.random.uniform(2, 8)  # Very short time to failure
-        elif warning_params > 0 or any(fp > 0.3 for fp in failure_predictions):
-            # Warning parameters or any significant failure risk
-            status = "WARNING" 
-            health_class = 1
-            confidence = 0.75 + (warning_params * 0.05)
-            ttf = np.random.uniform(12, 48) # Moderate time to failure
-        else:
-            # All parameters in good condition
-            status = "HEALTHY"
-            health_class = 0
-            confidence = 0.95
-            ttf = np.random.uniform(80, 150)  # Long time to failure
-        
-        # Adjust time to failure based on maximum failure probability
-        max_failure_prob = max(failure_predictions)
-        if max_failure_prob > 0.8:
-            ttf = min(ttf, np.random.uniform(1, 6))  # Very urgent
-        elif max_failure_prob > 0.5:
-            ttf = min(ttf, np.random.uniform(8, 24))  # Urgent
-        elif max_failure_prob > 0.3:
-            ttf = min(ttf, np.random.uniform(24, 72))  # Soon
-        
-        # Ensure confidence doesn't exceed 1.0
-        confidence = min(confidence, 1.0)
-        
-        return {
-            'predicted_status': status,
-            'predicted_class': health_class,
-            'confidence': confidence,
-            'health_probabilities': [0.9, 0.1, 0.0] if health_class == 0 else 
-                                   [0.2, 0.7, 0.1] if health_class == 1 else [0.1, 0.2, 0.7],
-            'failure_predictions': failure_predictions,
-            'time_to_failure': ttf,
-            'timestamp': datetime.now(),
-            'model_type': 'Simulation',
-            'issues': issues,
-            'critical_params': critical_params,
-            'warning_params': warning_params
-        }
-    
-    def analyze_failure_reasons(self, current_values, failure_predictions):
-        """Analyze specific failure reasons for each parameter"""
-        param_names = list(self.parameters.keys())
-        failure_analysis = []
-        
-        for i, (param_name, failure_prob) in enumerate(zip(param_names, failure_predictions)):
-            if failure_prob > 0.3:  # Significant failure risk
-                value = current_values[i]
-                pattern = self.failure_patterns[param_name]
-                
-                # Determine failure type
-                if value < pattern['warning_low']:
-                    reason = pattern['failure_reasons']['low']
-                    severity = "HIGH" if value < pattern['critical_low'] else "MEDIUM"
-                elif value > pattern['warning_high']:
-                    reason = pattern['failure_reasons']['high']
-                    severity = "HIGH" if value > pattern['critical_high'] else "MEDIUM"
-                else:
-                    reason = "Parameter trending towards failure range"
-                    severity = "LOW"
-                
-                failure_analysis.append({
-                    'parameter': param_name,
-                    'value': value,
-                    'failure_probability': failure_prob,
-                    'severity': severity,
-                    'reason': reason
-                })
-        
-        return failure_analysis
-    
-    def generate_maintenance_recommendations(self, result, failure_analysis):
-        """Generate specific maintenance recommendations"""
-        recommendations = []
-        
-        # Time-based recommendations
-        ttf = result['time_to_failure']
-        if ttf < 8:  # Less than 8 hours
-            recommendations.append({
-                'priority': 'URGENT',
-                'action': 'Immediate System Shutdown',
-                'description': 'Critical failure predicted within 8 hours. Stop operations immediately.',
-                'timeline': 'NOW'
-            })
-        elif ttf < 24:  # Less than 24 hours
-            recommendations.append({
-                'priority': 'HIGH',
-                'action': 'Emergency Maintenance',
-                'description': 'Schedule emergency maintenance within the next shift.',
-                'timeline': 'Within 4 hours'
-            })
-        elif ttf < 72:  # Less than 3 days
-            recommendations.append({
-                'priority': 'MEDIUM',
-                'action': 'Planned Maintenance',
-                'description': 'Schedule maintenance within 48 hours to prevent failure.',
-                'timeline': 'Within 2 days'
-            })
-        else:
-            recommendations.append({
-                'priority': 'LOW',
-                'action': 'Routine Inspection',
-                'description': 'Continue normal operations with increased monitoring.',
-                'timeline': 'Next scheduled maintenance'
-            })
-        
-        # Parameter-specific recommendations
-        for analysis in failure_analysis:
-            param = analysis['parameter']
-            severity = analysis['severity']
-            
-            if param == 'Temperature':
-                if analysis['value'] < 22:
-                    recommendations.append({
-                        'priority': severity,
-                        'action': 'Heating System Check',
-                        'description': 'Inspect heating elements, temperature sensors, and control systems.',
-                        'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
-                    })
-                else:
-                    recommendations.append({
-                        'priority': severity,
-                        'action': 'Cooling System Check',
-                        'description': 'Inspect ventilation, fans, and temperature control systems.',
-                        'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
-                    })
-            
-            elif param == 'Fan_Speed':
-                recommendations.append({
-                    'priority': severity,
-                    'action': 'Motor and Drive Inspection',
-                    'description': 'Check motor bearings, belt tension, electrical connections, and drive system.',
-                    'timeline': 'Next 12 hours' if severity == 'HIGH' else 'Next maintenance window'
-                })
-            
-            elif param == 'Air_Flow_Rate':
-                recommendations.append({
-                    'priority': severity,
-                    'action': 'Airflow System Maintenance',
-                    'description': 'Clean air filters, check ductwork, inspect fan blades and housing.',
-                    'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
-                })
-            
-            # Add more parameter-specific recommendations...
-        
-        return recommendations
-    
-    def update_displays(self, result, current_values):
+        return self._predictor.simulate(
+            window[-1], time.monotonic_ns() - self._start_ns)
+
+    def update_displays(self, result, current_values, failure_analysis=None, recommendations=None):
         """Update all display panels with current analysis"""
         # Update main status
-        status_colors = {'HEALTHY': '#27ae60', 'WARNING': '#f39c12', 'CRITICAL': '#e74c3c'}
-        status_emojis = {'HEALTHY': '🟢', 'WARNING': '🟡', 'CRITICAL': '🔴'}
-        
         status = result['predicted_status']
-        emoji = status_emojis[status]
-        color = status_colors[status]
+        emoji = self._status_emojis[status]
+        color = self._status_colors[status]
         
         self.main_status_label.config(text=f"{emoji} {status}", fg=color)
         self.confidence_label.config(text=f"Confidence: {result['confidence']:.1%}")
@@ -901,208 +1124,183 @@ class EnhancedPredictiveMonitor:
         
         self.ttf_label.config(text=ttf_text, fg=ttf_color)
         
-        # Analysis display
-        self.analysis_display.delete(1.0, tk.END)
-        
-        output = f"{'='*60}\n"
-        output += f"🧠 ENHANCED LSTM ANALYSIS\n"
-        output += f"{'='*60}\n"
-        output += f"Status: {emoji} {status}\n"
-        output += f"Confidence: {result['confidence']:.1%}\n"
-        output += f"Model: {result['model_type']}\n"
-        output += f"Time to Failure: {ttf:.1f} hours\n"
-        output += f"Timestamp: {result['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
+        # Analysis display - appended as a rolling log, capped by _trim_log.
+        # Built as a parts list and joined once: O(N) instead of O(N^2) concat
+        parts = [
+            f"{_RULE60}\n",
+            f"🧠 ENHANCED LSTM ANALYSIS\n",
+            f"{_RULE60}\n",
+            f"Status: {emoji} {status}\n",
+            f"Confidence: {result['confidence']:.1%}\n",
+            f"Model: {result['model_type']}\n",
+            f"Time to Failure: {ttf:.1f} hours\n",
+            f"Timestamp: {self._format_ts(result['timestamp'], '%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
+
         # Health probabilities
-        output += f"🎯 HEALTH PROBABILITIES\n"
-        output += f"{'-'*30}\n"
+        parts.append(f"🎯 HEALTH PROBABILITIES\n{_RULE30}\n")
         health_labels = ['Healthy', 'Warning', 'Critical']
-        for i, (label, prob) in enumerate(zip(health_labels, result['health_probabilities'])):
-            output += f"{label}: {prob:.1%}\n"
-        
+        for label, prob in zip(health_labels, result['health_probabilities']):
+            parts.append(f"{label}: {prob:.1%}\n")
+
         # Current sensor readings
-        output += f"\n📊 CURRENT SENSOR READINGS\n"
-        output += f"{'-'*40}\n"
-        param_names = list(self.parameters.keys())
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            config = self.parameters[param_name]
-            pattern = self.failure_patterns[param_name]
-            
-            # Status indicator
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status_icon = "🟢"
-            elif pattern['warning_low'] <= value <= pattern['warning_high']:
-                status_icon = "🟡"
-            else:
-                status_icon = "🔴"
-            
-            output += f"{status_icon} {param_name}: {value:.1f} {config['unit']}\n"
-        
+        parts.append(f"\n📊 CURRENT SENSOR READINGS\n{_RULE40}\n")
+        param_names = self._param_names
+        codes = self._predictor.status_codes(np.asarray(current_values, dtype=np.float32))
+        for param_name, value, code, unit in zip(param_names, current_values, codes, self._param_units):
+            parts.append(f"{_STATUS_STYLES[code][1]} {param_name}: {value:.1f} {unit}\n")
+
         # Failure predictions
-        output += f"\n⚠️ FAILURE PREDICTIONS\n"
-        output += f"{'-'*40}\n"
-        for i, (param_name, failure_prob) in enumerate(zip(param_names, result['failure_predictions'])):
+        parts.append(f"\n⚠️ FAILURE PREDICTIONS\n{_RULE40}\n")
+        for param_name, failure_prob in zip(param_names, result['failure_predictions']):
             if failure_prob > 0.3:
                 risk_level = "HIGH" if failure_prob > 0.7 else "MEDIUM"
-                output += f"🔴 {param_name}: {failure_prob:.1%} ({risk_level} RISK)\n"
+                parts.append(f"🔴 {param_name}: {failure_prob:.1%} ({risk_level} RISK)\n")
             else:
-                output += f"🟢 {param_name}: {failure_prob:.1%} (LOW RISK)\n"
-        
+                parts.append(f"🟢 {param_name}: {failure_prob:.1%} (LOW RISK)\n")
+
         # Buffer status
-        buffer_size = len(self.sensor_history)
-        output += f"\n📈 DATA BUFFER STATUS\n"
-        output += f"{'-'*40}\n"
-        output += f"Buffer: {buffer_size}/{self.sequence_length} points\n"
+        buffer_size = self._window_count
+        parts.append(f"\n📈 DATA BUFFER STATUS\n{_RULE40}\n")
+        parts.append(f"Buffer: {buffer_size}/{self.sequence_length} points\n")
         if buffer_size >= self.sequence_length:
-            output += f"✅ Full buffer - Enhanced predictions active\n"
+            parts.append("✅ Full buffer - Enhanced predictions active\n")
         else:
-            output += f"⏳ Building buffer for optimal predictions...\n"
-        
-        output += f"\n{'='*60}\n"
-        output += f"⏱️ Next update in 3 seconds...\n"
-        
-        self.analysis_display.insert(tk.END, output)
+            parts.append("⏳ Building buffer for optimal predictions...\n")
+
+        parts.append(f"\n{_RULE60}\n⏱️ Next update in 3 seconds...\n")
+
+        self.analysis_display.insert(tk.END, "".join(parts))
+        self._trim_log(self.analysis_display)
         self.analysis_display.see(tk.END)
         
-        # Update maintenance panels
-        failure_analysis = self.analyze_failure_reasons(current_values, result['failure_predictions'])
-        recommendations = self.generate_maintenance_recommendations(result, failure_analysis)
-        
+        # Update maintenance panels - the predictor thread normally hands the
+        # analysis in precomputed; recompute only when called directly
+        if failure_analysis is None:
+            failure_analysis = self._predictor.analyze(current_values, result['failure_predictions'])
+        if recommendations is None:
+            recommendations = self._predictor.recommend(result, failure_analysis)
+
         self.update_health_summary(current_values)
         self.update_failure_display(failure_analysis)
         self.update_maintenance_display(recommendations)
     
+    def _set_panel_text(self, widget, parts):
+        """Replace a read-only panel's contents with one joined insert"""
+        widget.config(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, "".join(parts))
+        widget.config(state='disabled')
+
     def update_health_summary(self, current_values):
         """Update parameter health summary"""
-        self.health_summary.config(state='normal')
-        self.health_summary.delete(1.0, tk.END)
-        
-        param_names = list(self.parameters.keys())
-        healthy_count = 0
-        warning_count = 0
-        critical_count = 0
-        
-        summary_text = "📊 PARAMETER HEALTH OVERVIEW\n"
-        summary_text += "=" * 35 + "\n\n"
-        
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
+        param_names = self._param_names
+        codes = self._predictor.status_codes(np.asarray(current_values, dtype=np.float32))
+        healthy_count = int((codes == 0).sum())
+        warning_count = int((codes == 1).sum())
+        critical_count = len(codes) - healthy_count - warning_count
+
+        parts = ["📊 PARAMETER HEALTH OVERVIEW\n", "=" * 35 + "\n\n"]
+
+        for param_name, value, code, unit in zip(param_names, current_values, codes, self._param_units):
             pattern = self.failure_patterns[param_name]
-            config = self.parameters[param_name]
-            
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status = "OPTIMAL"
-                icon = "🟢"
-                healthy_count += 1
-            elif pattern['warning_low'] <= value <= pattern['warning_high']:
-                status = "WARNING"
-                icon = "🟡"
-                warning_count += 1
-            else:
-                status = "CRITICAL"
-                icon = "🔴"
-                critical_count += 1
-            
-            summary_text += f"{icon} {param_name.replace('_', ' ')}\n"
-            summary_text += f"   Value: {value:.1f} {config['unit']}\n"
-            summary_text += f"   Status: {status}\n"
-            summary_text += f"   Optimal: {pattern['optimal_low']}-{pattern['optimal_high']}\n\n"
-        
+            parts.append(
+                f"{_STATUS_STYLES[code][1]} {param_name.replace('_', ' ')}\n"
+                f"   Value: {value:.1f} {unit}\n"
+                f"   Status: {LEVELS[code]}\n"
+                f"   Optimal: {pattern['optimal_low']}-{pattern['optimal_high']}\n\n"
+            )
+
         # Summary statistics
-        summary_text += f"📈 SUMMARY\n"
-        summary_text += f"-" * 20 + "\n"
-        summary_text += f"🟢 Optimal: {healthy_count}/6\n"
-        summary_text += f"🟡 Warning: {warning_count}/6\n"
-        summary_text += f"🔴 Critical: {critical_count}/6\n"
-        
-        self.health_summary.insert(tk.END, summary_text)
-        self.health_summary.config(state='disabled')
+        parts.append(f"📈 SUMMARY\n{'-'*20}\n")
+        parts.append(f"🟢 Optimal: {healthy_count}/6\n")
+        parts.append(f"🟡 Warning: {warning_count}/6\n")
+        parts.append(f"🔴 Critical: {critical_count}/6\n")
+
+        self._set_panel_text(self.health_summary, parts)
     
     def update_failure_display(self, failure_analysis):
         """Update failure predictions display"""
-        self.failure_display.config(state='normal')
-        self.failure_display.delete(1.0, tk.END)
-        
-        failure_text = "⚠️ FAILURE ANALYSIS\n"
-        failure_text += "=" * 25 + "\n\n"
-        
+        parts = ["⚠️ FAILURE ANALYSIS\n", "=" * 25 + "\n\n"]
+
         if not failure_analysis:
-            failure_text += "✅ No significant failure risks detected.\n"
-            failure_text += "All parameters within acceptable ranges.\n"
+            parts.append("✅ No significant failure risks detected.\n")
+            parts.append("All parameters within acceptable ranges.\n")
         else:
-            failure_text += f"🔍 {len(failure_analysis)} parameter(s) at risk:\n\n"
-            
+            parts.append(f"🔍 {len(failure_analysis)} parameter(s) at risk:\n\n")
+
             for analysis in failure_analysis:
-                severity_colors = {
-                    'HIGH': '🔴',
-                    'MEDIUM': '🟡', 
-                    'LOW': '🟠'
-                }
-                
-                icon = severity_colors.get(analysis['severity'], '⚠️')
-                failure_text += f"{icon} {analysis['parameter'].replace('_', ' ')}\n"
-                failure_text += f"   Risk: {analysis['failure_probability']:.1%}\n"
-                failure_text += f"   Severity: {analysis['severity']}\n"
-                failure_text += f"   Current: {analysis['value']:.1f}\n"
-                failure_text += f"   Reason: {analysis['reason']}\n\n"
-        
-        self.failure_display.insert(tk.END, failure_text)
-        self.failure_display.config(state='disabled')
+                icon = self._severity_icons.get(analysis['severity'], '⚠️')
+                parts.append(
+                    f"{icon} {analysis['parameter'].replace('_', ' ')}\n"
+                    f"   Risk: {analysis['failure_probability']:.1%}\n"
+                    f"   Severity: {analysis['severity']}\n"
+                    f"   Current: {analysis['value']:.1f}\n"
+                    f"   Reason: {analysis['reason']}\n\n"
+                )
+
+        self._set_panel_text(self.failure_display, parts)
     
     def update_maintenance_display(self, recommendations):
         """Update maintenance recommendations display"""
-        self.maintenance_display.config(state='normal')
-        self.maintenance_display.delete(1.0, tk.END)
-        
-        maint_text = "🔧 MAINTENANCE SCHEDULE\n"
-        maint_text += "=" * 30 + "\n\n"
-        
-        # Sort by priority
-        priority_order = {'URGENT': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 4))
-        
+        parts = ["🔧 MAINTENANCE SCHEDULE\n", "=" * 30 + "\n\n"]
+
+        # Sort by the integer priority key precomputed at insertion
+        recommendations.sort(key=itemgetter('_pri'))
+
         for i, rec in enumerate(recommendations, 1):
-            priority_icons = {
-                'URGENT': '🚨',
-                'HIGH': '🔴',
-                'MEDIUM': '🟡',
-                'LOW': '🟢'
-            }
-            
-            icon = priority_icons.get(rec['priority'], '📋')
-            maint_text += f"{i}. {icon} {rec['action']}\n"
-            maint_text += f"   Priority: {rec['priority']}\n"
-            maint_text += f"   Timeline: {rec['timeline']}\n"
-            maint_text += f"   Description: {rec['description']}\n\n"
-        
+            icon = self._priority_icons.get(rec['priority'], '📋')
+            parts.append(
+                f"{i}. {icon} {rec['action']}\n"
+                f"   Priority: {rec['priority']}\n"
+                f"   Timeline: {rec['timeline']}\n"
+                f"   Description: {rec['description']}\n\n"
+            )
+
         # Add general recommendations
-        maint_text += "💡 GENERAL RECOMMENDATIONS\n"
-        maint_text += "-" * 25 + "\n"
-        maint_text += "• Monitor critical parameters closely\n"
-        maint_text += "• Document all maintenance activities\n"
-        maint_text += "• Keep spare parts inventory updated\n"
-        maint_text += "• Train operators on early warning signs\n"
-        
-        self.maintenance_display.insert(tk.END, maint_text)
-        self.maintenance_display.config(state='disabled')
+        parts.append(f"💡 GENERAL RECOMMENDATIONS\n{'-'*25}\n")
+        parts.append("• Monitor critical parameters closely\n")
+        parts.append("• Document all maintenance activities\n")
+        parts.append("• Keep spare parts inventory updated\n")
+        parts.append("• Train operators on early warning signs\n")
+
+        self._set_panel_text(self.maintenance_display, parts)
     
     def start_monitoring(self):
         """Start the enhanced monitoring process"""
         self.is_monitoring = True
         self.recording_start_time = time.time()
         self.data_points_recorded = 0
+        self._start_ns = time.monotonic_ns()
+        self._start_wall = time.time()
         
         # Update buttons
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         
         # Clear history
-        self.sensor_history.clear()
+        self.prediction_history.clear()
         self.timestamps.clear()
+        self._window_count = 0
         
-        # Start monitoring thread
-        self.monitoring_thread = threading.Thread(target=self.monitoring_loop, daemon=True)
+        # New generation: a sampler left over from a previous session exits
+        # at its next loop check instead of running alongside the new one.
+        # Flush frames/results queued by the old session before sampling
+        self._run_gen += 1
+        for q in (self._infer_q, self._result_q):
+            try:
+                while True:
+                    q.get_nowait()
+            except queue.Empty:
+                pass
+
+        # Start the sampler thread and the GUI result drain - the inference
+        # worker is persistent and already waiting on the frame queue
+        self.monitoring_thread = threading.Thread(
+            target=self.monitoring_loop, args=(self._run_gen,), daemon=True)
         self.monitoring_thread.start()
-        
+        self.root.after(100, self.drain_results)
+
         self.main_status_label.config(text="🔄 MONITORING ACTIVE", fg='#3498db')
     
     def stop_monitoring(self):
@@ -1122,8 +1320,9 @@ class EnhancedPredictiveMonitor:
         self.data_points_recorded = 0
         
         # Clear all data
-        self.sensor_history.clear()
+        self.prediction_history.clear()
         self.timestamps.clear()
+        self._window_count = 0
         
         # Clear active alerts
         self.active_alerts.clear()
@@ -1172,51 +1371,110 @@ class EnhancedPredictiveMonitor:
 """
         self.analysis_display.insert(tk.END, initial_msg)
     
-    def monitoring_loop(self):
-        """Enhanced monitoring loop with predictive analytics"""
-        while self.is_monitoring:
+    def monitoring_loop(self, gen):
+        """Enhanced monitoring loop with predictive analytics (one sampler per session generation)"""
+        while self.is_monitoring and gen == self._run_gen:
             try:
                 # Get current sensor values
                 current_values = self.get_current_values()
-                current_time = datetime.now()
-                
-                # Add to history
-                self.sensor_history.append(current_values)
-                self.timestamps.append(current_time)
-                
-                # Keep only required sequence length
-                if len(self.sensor_history) > self.sequence_length:
-                    self.sensor_history = self.sensor_history[-self.sequence_length:]
-                    self.timestamps = self.timestamps[-self.sequence_length:]
-                
-                # Make prediction
-                result = self.predict_health(self.sensor_history)
-                
-                if result:
-                    # Update GUI in main thread
-                    self.root.after(0, self.update_displays, result, current_values)
-                    
-                    # Update timer
-                    self.root.after(0, self.update_timer)
-                    
-                    # Check for critical and warning conditions
-                    if result['predicted_status'] in ['CRITICAL', 'WARNING']:
-                        if (result['predicted_status'] == 'CRITICAL' and 
-                            result['confidence'] > 0.8 and 
-                            result['time_to_failure'] < 24):  # Extended time for alerts
-                            self.root.after(0, self.emergency_alert, result)
-                        elif (result['predicted_status'] == 'WARNING' and 
-                              result['confidence'] > 0.7 and 
-                              result['time_to_failure'] < 48):  # Warning threshold
-                            self.root.after(0, self.emergency_alert, result)
-                
+                t_ns = time.monotonic_ns() - self._start_ns
+
+                # The float32 ring window is the only history store now
+                self.timestamps.append(t_ns)
+                self.push_sample(current_values)
+
+                # Hand the frame plus a window snapshot to the inference
+                # worker - the live ring keeps shifting, so the worker must
+                # not read it. Drop the oldest frame on backpressure so the
+                # sampler never stalls
+                item = (current_values, self._seq_buf.copy())
+                try:
+                    self._infer_q.put_nowait(item)
+                except queue.Full:
+                    try:
+                        self._infer_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    try:
+                        self._infer_q.put_nowait(item)
+                    except queue.Full:
+                        pass
+
                 self.data_points_recorded += 1
                 time.sleep(3)  # 3-second intervals
-                
+
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
                 time.sleep(5)
-    
+
+    def inference_loop(self):
+        """Persistent predictor thread: model call plus failure/maintenance analysis, all off the Tk main thread"""
+        while True:
+            current_values, window = self._infer_q.get()
+            try:
+                result = self.predict_health(window)
+                if not result:
+                    continue
+                failure_analysis = self._predictor.analyze(
+                    current_values, result['failure_predictions'])
+                recommendations = self._predictor.recommend(result, failure_analysis)
+
+                # Pre-render the alert body here so a firing alert only costs
+                # the Tk thread one Label creation
+                if result['predicted_status'] in ('CRITICAL', 'WARNING'):
+                    cv = np.asarray(current_values, dtype=np.float32)
+                    crit_idx = np.nonzero((cv <= self._predictor.crit_lo) | (cv >= self._predictor.crit_hi))[0]
+                    result['alert_params'] = [
+                        (self._param_names[i], current_values[i]) for i in crit_idx]
+                    result['alert_text'] = self._build_alert_text(
+                        result, result['alert_params'], current_values)
+
+                # Drop the oldest finished result on backpressure - the GUI
+                # only ever needs the newest one
+                item = (result, current_values, failure_analysis, recommendations)
+                try:
+                    self._result_q.put_nowait(item)
+                except queue.Full:
+                    try:
+                        self._result_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    try:
+                        self._result_q.put_nowait(item)
+                    except queue.Full:
+                        pass
+            except Exception as e:
+                print(f"Error in inference worker: {e}")
+
+    def drain_results(self):
+        """Render the newest finished prediction on the main thread, discarding stale ones"""
+        item = None
+        try:
+            while True:
+                item = self._result_q.get_nowait()
+        except queue.Empty:
+            pass
+
+        if item is not None:
+            result, current_values, failure_analysis, recommendations = item
+            self.update_displays(result, current_values, failure_analysis, recommendations)
+            self.update_timer()
+
+            # Check for critical and warning conditions
+            if result['predicted_status'] in ['CRITICAL', 'WARNING']:
+                if (result['predicted_status'] == 'CRITICAL' and
+                    result['confidence'] > 0.8 and
+                    result['time_to_failure'] < 24):  # Extended time for alerts
+                    self.emergency_alert(result, current_values)
+                elif (result['predicted_status'] == 'WARNING' and
+                      result['confidence'] > 0.7 and
+                      result['time_to_failure'] < 48):  # Warning threshold
+                    self.emergency_alert(result, current_values)
+
+        if self.is_monitoring:
+            self.root.after(100, self.drain_results)
+
+
     def update_timer(self):
         """Update the timer display"""
         if self.recording_start_time and self.timer_label:
@@ -1224,35 +1482,79 @@ class EnhancedPredictiveMonitor:
             minutes = int(elapsed_time // 60)
             seconds = int(elapsed_time % 60)
             
-            buffer_size = len(self.sensor_history)
+            buffer_size = self._window_count
             timer_text = f"⏱️ Timer: {minutes:02d}:{seconds:02d} | Points: {self.data_points_recorded} | Buffer: {buffer_size}/{self.sequence_length}"
             self.timer_label.config(text=timer_text)
     
-    def emergency_alert(self, result):
+    def emergency_alert(self, result, current_values=None):
         """Show emergency alert for critical conditions in separate window"""
-        # Generate unique alert ID based on status and critical parameters
-        critical_params = []
-        param_names = list(self.parameters.keys())
-        current_values = self.get_current_values()
-        
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            pattern = self.failure_patterns[param_name]
-            if value <= pattern['critical_low'] or value >= pattern['critical_high']:
-                critical_params.append(param_name)
-        
-        alert_id = f"{result['predicted_status']}_{'-'.join(sorted(critical_params))}"
-        
+        # The tick's values are passed through so the alert path doesn't
+        # re-read the six Tk sliders
+        if current_values is None:
+            current_values = self.get_current_values()
+
+        # Critical parameters as (name, value) pairs - precomputed by the
+        # predictor thread when the result came through the pipeline
+        critical_params = result.get('alert_params')
+        if critical_params is None:
+            cv = np.asarray(current_values, dtype=np.float32)
+            crit_idx = np.nonzero((cv <= self._predictor.crit_lo) | (cv >= self._predictor.crit_hi))[0]
+            critical_params = [(self._param_names[i], current_values[i]) for i in crit_idx]
+
+        alert_id = f"{result['predicted_status']}_{'-'.join(sorted(name for name, _ in critical_params))}"
+
         # Check if this alert is already being shown
         if alert_id in self.active_alerts:
             return  # Don't create duplicate alerts
-        
+
         # Add to active alerts
         self.active_alerts.add(alert_id)
-        
+
         # Create separate alert window
-        self.create_alert_window(result, critical_params, alert_id)
-    
-    def create_alert_window(self, result, critical_params, alert_id):
+        self.create_alert_window(result, critical_params, alert_id, current_values)
+
+    def _build_alert_text(self, result, critical_params, current_values):
+        """Assemble the alert window body as one string - pure string work, safe off the Tk thread"""
+        parts = [
+            f"⏰ Time: {self._format_ts(result['timestamp'], '%H:%M:%S')}\n",
+            f"🎯 Confidence: {result['confidence']:.1%}\n",
+            f"⚡ Time to Failure: {result['time_to_failure']:.1f} hours\n\n",
+        ]
+
+        if critical_params:
+            parts.append("🔴 Critical Parameters:\n")
+            for param, current_value in critical_params:
+                parts.append(f"   • {param.replace('_', ' ')}: {current_value:.1f}\n")
+            parts.append("\n")
+
+        # Parameter status overview - classified from the tick's values
+        parts.append("📊 All Parameter Status:\n")
+        codes = self._predictor.status_codes(np.asarray(current_values, dtype=np.float32))
+        for param_name, value, code, unit in zip(self._param_names, current_values, codes, self._param_units):
+            parts.append(
+                f"   {_STATUS_STYLES[code][1]} {param_name.replace('_', ' ')}: "
+                f"{value:.1f} {unit} ({LEVELS[code]})\n"
+            )
+
+        parts.append("\n🔧 Immediate Actions Required:\n")
+        if result['predicted_status'] == 'CRITICAL':
+            parts.append(
+                "1. Stop machine operations immediately\n"
+                "2. Investigate critical parameters\n"
+                "3. Contact maintenance team\n"
+                "4. Do not restart until issue resolved"
+            )
+        else:
+            parts.append(
+                "1. Monitor parameters closely\n"
+                "2. Prepare for potential shutdown\n"
+                "3. Schedule maintenance check\n"
+                "4. Document current conditions"
+            )
+
+        return "".join(parts)
+
+    def create_alert_window(self, result, critical_params, alert_id, current_values):
         """Create a separate alert window for warnings/critical alerts"""
         # Create new top-level window
         alert_window = tk.Toplevel(self.root)
@@ -1324,22 +1626,13 @@ class EnhancedPredictiveMonitor:
         canvas.pack(side="left", fill="both", expand=True)
         content_scrollbar.pack(side="right", fill="y")
         
-        # Enhanced mousewheel binding for alert window
+        # Wheel events bound straight on the alert canvas - no per-event
+        # winfo_containing lookup or enter/leave bind_all juggling
         def _on_alert_mousewheel(event):
-            if canvas.winfo_containing(event.x_root, event.y_root) == canvas:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_alert_mousewheel(event):
-            alert_window.bind_all("<MouseWheel>", _on_alert_mousewheel)
-        
-        def _unbind_alert_mousewheel(event):
-            alert_window.unbind_all("<MouseWheel>")
-        
-        # Bind mouse wheel only when hovering over alert content
-        canvas.bind('<Enter>', _bind_alert_mousewheel)
-        canvas.bind('<Leave>', _unbind_alert_mousewheel)
-        scrollable_content.bind('<Enter>', _bind_alert_mousewheel)
-        scrollable_content.bind('<Leave>', _unbind_alert_mousewheel)
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+        canvas.bind("<MouseWheel>", _on_alert_mousewheel)
+        scrollable_content.bind("<MouseWheel>", _on_alert_mousewheel)
         
         # Add scroll indicator to alert
         scroll_indicator = tk.Label(
@@ -1350,75 +1643,20 @@ class EnhancedPredictiveMonitor:
         )
         scroll_indicator.pack(pady=(5, 0))
         
-        # Alert details in scrollable content
-        details_text = f"⏰ Time: {result['timestamp'].strftime('%H:%M:%S')}\n"
-        details_text += f"🎯 Confidence: {result['confidence']:.1%}\n"
-        details_text += f"⚡ Time to Failure: {result['time_to_failure']:.1f} hours\n\n"
-        
-        if critical_params:
-            details_text += f"🔴 Critical Parameters:\n"
-            for param in critical_params:
-                current_value = self.get_current_values()[list(self.parameters.keys()).index(param)]
-                details_text += f"   • {param.replace('_', ' ')}: {current_value:.1f}\n"
-            details_text += "\n"
-        
-        # Add parameter status overview
-        details_text += f"📊 All Parameter Status:\n"
-        param_names = list(self.parameters.keys())
-        current_values = self.get_current_values()
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            pattern = self.failure_patterns[param_name]
-            config = self.parameters[param_name]
-            
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status_icon = "🟢"
-                status_text = "OPTIMAL"
-            elif pattern['warning_low'] <= value <= pattern['warning_high']:
-                status_icon = "🟡"
-                status_text = "WARNING"
-            else:
-                status_icon = "🔴"
-                status_text = "CRITICAL"
-            
-            details_text += f"   {status_icon} {param_name.replace('_', ' ')}: {value:.1f} {config['unit']} ({status_text})\n"
-        
+        # Alert details - prebuilt off-thread by the predictor when possible,
+        # rendered as a single Label instead of three separate widgets
+        alert_text = result.get('alert_text')
+        if alert_text is None:
+            alert_text = self._build_alert_text(result, critical_params, current_values)
+
         details_label = tk.Label(
-            scrollable_content, 
-            text=details_text,
-            font=('Consolas', 10), 
-            bg='#ecf0f1', fg='#2c3e50',
-            justify='left'
-        )
-        details_label.pack(anchor='w', pady=(0, 15), padx=10)
-        
-        # Recommended actions
-        actions_label = tk.Label(
-            scrollable_content,
-            text="🔧 Immediate Actions Required:",
-            font=('Arial', 12, 'bold'),
-            bg='#ecf0f1', fg='#2c3e50'
-        )
-        actions_label.pack(anchor='w', pady=(10, 5), padx=10)
-        
-        if status == 'CRITICAL':
-            actions_text = "1. Stop machine operations immediately\n"
-            actions_text += "2. Investigate critical parameters\n" 
-            actions_text += "3. Contact maintenance team\n"
-            actions_text += "4. Do not restart until issue resolved"
-        else:
-            actions_text = "1. Monitor parameters closely\n"
-            actions_text += "2. Prepare for potential shutdown\n"
-            actions_text += "3. Schedule maintenance check\n"
-            actions_text += "4. Document current conditions"
-        
-        actions_content = tk.Label(
             scrollable_content,
-            text=actions_text,
-            font=('Arial', 10),
+            text=alert_text,
+            font=('Consolas', 10),
             bg='#ecf0f1', fg='#2c3e50',
             justify='left'
         )
-        actions_content.pack(anchor='w', pady=(0, 20), padx=10)
+        details_label.pack(anchor='w', pady=(0, 20), padx=10)
         
         # Buttons frame (outside scrollable area, at bottom)
         button_frame = tk.Frame(alert_window, bg='#ecf0f1')
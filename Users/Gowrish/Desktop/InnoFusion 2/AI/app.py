@@ -11,30 +11,97 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import pandas as pd
+import importlib.util
+import logging
+import sys
+from collections import deque
+import os
 import numpy as np
 import pickle
+import queue
 import threading
 import time
-from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Optional matplotlib import
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Availability probed without importing - matplotlib and TensorFlow cost
+# seconds at import time and would delay the first window paint; the real
+# imports happen lazily in load_model / first chart use
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+if not MATPLOTLIB_AVAILABLE:
     print("⚠️  Matplotlib not available - charts disabled")
 
+TENSORFLOW_AVAILABLE = None  # unknown until load_model probes it
+
+# Optional Numba import - JIT-compiles the simulation-mode scoring kernel
 try:
-    from tensorflow.keras.models import load_model
-    TENSORFLOW_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    TENSORFLOW_AVAILABLE = False
-    print("⚠️  TensorFlow not available - using simulation mode")
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernel below stays plain Python without Numba"""
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_health(values, opt_lo, opt_hi, fail_out):
+    """Rule-based scoring: fills per-parameter failure probabilities and
+    returns the count of non-optimal (critical) parameters."""
+    n_crit = 0
+    for i in range(values.shape[0]):
+        if opt_lo[i] <= values[i] <= opt_hi[i]:
+            fail_out[i] = 0.02
+        else:
+            fail_out[i] = 0.85
+            n_crit += 1
+    return n_crit
+
+
+@njit(cache=True, fastmath=True)
+def _classify_head(health_pred):
+    """Argmax plus confidence over the health head in one native pass"""
+    c = 0
+    best = health_pred[0]
+    for i in range(1, health_pred.shape[0]):
+        if health_pred[i] > best:
+            best = health_pred[i]
+            c = i
+    return c, best
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT cache at import so the first simulated tick pays no compile cost
+    _warm = np.zeros(1, dtype=np.float32)
+    _simulate_health(_warm, _warm, _warm, np.empty(1, dtype=np.float32))
+    _classify_head(np.zeros(3, dtype=np.float32))
+    del _warm
+
+# Status / severity / priority lookup tables shared by the renderers -
+# module constants instead of fresh dict literals per call
+_STATUS_NAMES = ("HEALTHY", "WARNING", "CRITICAL")
+_STATUS_COLORS = {'HEALTHY': '#27ae60', 'WARNING': '#f39c12', 'CRITICAL': '#e74c3c'}
+_STATUS_EMOJIS = {'HEALTHY': '🟢', 'WARNING': '🟡', 'CRITICAL': '🔴'}
+_SEVERITY_ICONS = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟠'}
+_PRIORITY_ORDER = {'URGENT': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+_PRIORITY_ICONS = {'URGENT': '🚨', 'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}
+
+# Per-tick diagnostics go through the logger - silent (and unformatted)
+# at the default WARNING level, enabled with the --debug flag
+_log = logging.getLogger(__name__)
+
+# Separator rules shared by the display builders - built once, not per tick
+_EQ60 = "=" * 60
+_EQ35 = "=" * 35
+_EQ30 = "=" * 30
+_EQ25 = "=" * 25
+_DASH40 = "-" * 40
+_DASH30 = "-" * 30
+_DASH25 = "-" * 25
+_DASH20 = "-" * 20
 
 class EnhancedPredictiveMonitor:
     """
@@ -51,6 +118,22 @@ class EnhancedPredictiveMonitor:
         self.model = None
         self.scaler = None
         self.model_loaded = False
+
+        # Optional int8 TFLite interpreter - replaces Keras predict on the
+        # hot path when conversion succeeds
+        self.interpreter = None
+        self._in_detail = None
+        self._out_details = ()
+        self._out_heads = None   # head-name -> output detail for multi-head models
+
+        # Shape-locked tf.function over model.__call__ - the Keras fallback
+        # when TFLite conversion fails, cheaper than model.predict per call
+        self._infer = None
+
+        # Scaler constants cached as float32 so the hot path scales inline
+        # instead of paying sklearn's per-call validation
+        self._scaler_mean = None
+        self._scaler_inv_scale = None
         
         # Monitoring state
         self.is_monitoring = False
@@ -59,14 +142,55 @@ class EnhancedPredictiveMonitor:
         self.data_points_recorded = 0
         
         # Data storage
-        self.sensor_history = []
         self.prediction_history = []
-        self.timestamps = []
         self.sequence_length = 10  # Updated to match working LSTM model (was 15)
+        # Bounded deque - O(1) append with the window trim handled by maxlen
+        self.timestamps = deque(maxlen=self.sequence_length)
+
+        # Last rendered text/state per parameter - lets update_value_label
+        # skip the Tcl round-trips when nothing visible changed
+        self._last_text = {}
+        self._last_state = {}
+
+        # Same idea for the three headline widgets in the status panel
+        self._last_main_status = None
+        self._last_conf_text = None
+        self._last_ttf = None
+
+        # Sensor history as a preallocated float32 ring buffer - O(1) append
+        # with no per-tick list slicing or dtype conversion
+        self._N = 4096
+        self._hist = np.empty((self._N, 6), dtype=np.float32)
+        self._hist_idx = 0
+        self._hist_count = 0
+
+        # Reusable LSTM input tensor - scaled windows are written in place
+        # instead of allocating a fresh (1, seq, 6) array per prediction
+        self._X = np.empty((1, self.sequence_length, 6), dtype=np.float32)
+
+        # Scratch window for the padded warm-up path - filled in place
+        # instead of tile+vstack while the history is still short
+        self._pad_buf = np.empty((self.sequence_length, 6), dtype=np.float32)
+
+        # Prediction memo keyed by the rounded window bytes - repeated ticks
+        # with unchanged sliders skip the model entirely
+        self._pred_cache = {}
+        self._pred_cache_max = 256
+
+        # Deterministic filler outputs for models without failure/TTF heads,
+        # indexed by health class - no RNG draws on the prediction path
+        self._fake_fail = (
+            np.full(6, 0.175, dtype=np.float32),
+            np.full(6, 0.5, dtype=np.float32),
+            np.full(6, 0.8, dtype=np.float32),
+        )
+        self._fake_ttf = (120.0, 48.0, 8.0)
         
-        # Alert management
-        self.active_alerts = set()  # Track active alert types
-        self.alert_windows = {}     # Track open alert windows
+        # Alert management - active alerts live in an integer bitmask with one
+        # bit per (parameter, status) pair, so dedup is two int ops instead of
+        # string building plus set hashing
+        self._alerts_mask = 0
+        self.alert_windows = {}     # Track open alert windows (keyed by bitmask)
         self.alert_cooldown_until = 0  # Timestamp when alerts can be shown again
         
         # Parameter definitions
@@ -78,7 +202,18 @@ class EnhancedPredictiveMonitor:
             'Heating_Power': {'min': 8.0, 'max': 20.0, 'default': 15.0, 'unit': 'kW'},
             'Fan_Power': {'min': 150.0, 'max': 300.0, 'default': 225.0, 'unit': 'W'}
         }
-        
+
+        # One bit per (parameter, status) pair, plus an overall bit per status
+        # so alerts with no out-of-range parameters still get a nonzero mask
+        self._alert_bits = {
+            key: 1 << i
+            for i, key in enumerate(
+                (name, status)
+                for name in list(self.parameters) + ['_overall']
+                for status in ('WARNING', 'CRITICAL')
+            )
+        }
+
         # Failure analysis patterns - CORRECTED LOGIC
         self.failure_patterns = {
             'Temperature': {
@@ -136,29 +271,214 @@ class EnhancedPredictiveMonitor:
                 }
             }
         }
-        
+
+        # Parameter table flattened from the two dict-of-dicts into one
+        # structured array (AoS -> SoA) - hot code indexes contiguous
+        # float32 columns instead of doing two dict lookups per field
+        self._param_order = list(self.parameters)
+        self._param_idx = {name: i for i, name in enumerate(self._param_order)}
+        self._param_units = tuple(self.parameters[k]['unit'] for k in self._param_order)
+        self.P = np.zeros(len(self._param_order), dtype=[
+            ('min', 'f4'), ('max', 'f4'), ('default', 'f4'),
+            ('cl', 'f4'), ('wl', 'f4'), ('ol', 'f4'),
+            ('oh', 'f4'), ('wh', 'f4'), ('ch', 'f4')
+        ])
+        for i, name in enumerate(self._param_order):
+            cfg = self.parameters[name]
+            pat = self.failure_patterns[name]
+            self.P[i] = (cfg['min'], cfg['max'], cfg['default'],
+                         pat['critical_low'], pat['warning_low'], pat['optimal_low'],
+                         pat['optimal_high'], pat['warning_high'], pat['critical_high'])
+
+        # Per-parameter printf-style formatters - "%.1f unit" dispatches
+        # straight into the C float formatter, cheaper than an f-string
+        # rebuilt on every slider update. Literal '%' in a unit (Humidity)
+        # must be doubled to survive the format pass
+        self._fmt = {n: ("%.1f " + p['unit'].replace('%', '%%')).__mod__
+                     for n, p in self.parameters.items()}
+
+        # Threshold matrix view for the vectorized classifier - one row per
+        # parameter with [crit_lo, warn_lo, opt_lo, opt_hi, warn_hi, crit_hi]
+        self._thr = np.column_stack(
+            [self.P['cl'], self.P['wl'], self.P['ol'],
+             self.P['oh'], self.P['wh'], self.P['ch']]
+        )
+
+        # Per-parameter bucket edges [warn_lo, opt_lo, opt_hi, warn_hi] for
+        # the slider labels - one searchsorted replaces the if/elif chain.
+        # Upper edges are nudged one ulp so both range bounds stay inclusive,
+        # matching the old comparisons exactly
+        self._buckets = self._thr[:, 1:5].copy()
+        self._buckets[:, 2:] = np.nextafter(self._buckets[:, 2:], np.inf)
+        self._state_colors = ('#e74c3c', '#f39c12', '#27ae60', '#f39c12', '#e74c3c')
+        self._state_icons = ('🔴', '🟡', '🟢', '🟡', '🔴')
+
         # GUI components
         self.sliders = {}
         self.value_labels = {}
-        self.status_displays = {}
+        self.value_vars = {}
+        self._status_ids = {}
+        self._status_canvas = None
+
+        # Maintenance-panel widgets exist only after first reveal
+        self.health_summary = None
+        self.failure_display = None
+        self.maintenance_display = None
+
+        # Slider-drag coalescing - a drag emits command callbacks at
+        # mouse-move rate, so dirty values are batched into one idle flush
+        self._pending_slider = {}
+        self._slider_flush_scheduled = False
+
+        # Analysis log line cap - keeps each Text insert constant-time on
+        # long runs instead of reflowing an ever-growing buffer
+        self._max_log_lines = 500
+
+        # Analysis log write queue - appends are coalesced into one
+        # enable/insert/disable pass per idle cycle
+        self._analysis_queue = []
+        self._analysis_flush_scheduled = False
+
+        # Last rendered text per side panel - a rewrite is skipped entirely
+        # when the regenerated content is byte-identical
+        self._panel_cache = {}
+
+        # Wall-clock string cache - strftime runs at most once per second
+        # instead of on every tick and alert render
+        self._now_text = ''
+        self._now_stamp = 0.0
         
         # Store canvas reference for manual scroll updates
         self.sensor_canvas = None
         self.sensor_scrollable_frame = None
         
-        # Load model and setup GUI
-        self.load_model()
+        # Setup GUI first, then load the model once the window has painted -
+        # the TensorFlow import alone costs seconds and would block first draw
         self.setup_gui()
-    
+        self._build_estop_dialog()
+        self.root.after(50, self.load_model)
+
+        # Monitoring-loop stop signal - waiting on the event instead of
+        # sleeping lets stop/reset interrupt the tick immediately
+        self._stop_event = threading.Event()
+
+        # Inference worker - model calls never run on the Tk main thread;
+        # the bounded queue keeps only the newest window when inference lags
+        self._infer_in = queue.Queue(maxsize=1)
+        self._infer_thread = threading.Thread(target=self._infer_worker, daemon=True)
+        self._infer_thread.start()
+
+    def _classify(self, v):
+        """Vectorized per-parameter status codes: 0=optimal, 1=warning, 2=critical"""
+        t = self._thr
+        v = np.asarray(v, dtype=np.float32)
+        optimal = (v >= t[:, 2]) & (v <= t[:, 3])
+        warning = ~optimal & (v >= t[:, 1]) & (v <= t[:, 4])
+        return np.where(optimal, 0, np.where(warning, 1, 2))
+
+    def _append_sample(self, values):
+        """Write one sample into the ring buffer"""
+        self._hist[self._hist_idx] = values
+        self._hist_idx = (self._hist_idx + 1) % self._N
+        if self._hist_count < self._N:
+            self._hist_count += 1
+
+    def _last_sequence(self):
+        """Newest-to-oldest-ordered view of the last sequence_length samples"""
+        n = min(self._hist_count, self.sequence_length)
+        if n == 0:
+            return self._hist[:0]
+        start = self._hist_idx - n
+        if start >= 0:
+            return self._hist[start:self._hist_idx]
+        return np.concatenate((self._hist[start:], self._hist[:self._hist_idx]))
+
+    def _submit_inference(self, sensor_data, current_values):
+        """Queue a window for the inference worker, dropping a stale one if full"""
+        item = (sensor_data, current_values)
+        try:
+            self._infer_in.put_nowait(item)
+        except queue.Full:
+            try:
+                self._infer_in.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._infer_in.put_nowait(item)
+            except queue.Full:
+                pass
+
+    def _infer_worker(self):
+        """Pull windows off the queue and run predictions off the Tk thread"""
+        while True:
+            sensor_data, current_values = self._infer_in.get()
+            try:
+                # Memoize on the rounded window - steady sliders produce an
+                # identical window every tick, so the model only runs when
+                # the inputs actually moved
+                key = np.round(np.asarray(sensor_data, dtype=np.float32), 1).tobytes()
+                result = self._pred_cache.get(key)
+                if result is None:
+                    result = self.predict_health(sensor_data)
+                    if result:
+                        if len(self._pred_cache) >= self._pred_cache_max:
+                            self._pred_cache.clear()
+                        self._pred_cache[key] = result
+                if result:
+                    self.root.after(0, self._apply_prediction, result, current_values)
+            except Exception as e:
+                print(f"❌ Inference worker error: {e}")
+
+    def _apply_prediction(self, result, current_values):
+        """Render a finished prediction on the main thread"""
+        self.update_displays(result, current_values)
+        self.update_timer()
+
+        if result['predicted_status'] == 'CRITICAL':
+            self.emergency_alert(result)
+        elif result['predicted_status'] == 'WARNING' and result['confidence'] > 0.6:
+            self.emergency_alert(result)
+
+    def _build_estop_dialog(self):
+        """Pre-build the emergency-stop confirmation as a hidden non-modal window"""
+        # messagebox.showinfo spins a nested Tcl event loop that stalls the
+        # after-callback pipeline; a cached withdrawn Toplevel avoids both
+        # the nested loop and the per-alert window construction cost
+        self._estop_dialog = tk.Toplevel(self.root)
+        self._estop_dialog.title("Emergency Stop Activated")
+        self._estop_dialog.configure(bg='#2c3e50')
+        self._estop_dialog.withdraw()
+        self._estop_dialog.protocol("WM_DELETE_WINDOW", self._estop_dialog.withdraw)
+
+        self._estop_label = tk.Label(
+            self._estop_dialog,
+            text="",
+            font=('Arial', 12),
+            bg='#2c3e50', fg='white',
+            justify='left',
+            padx=20, pady=15
+        )
+        self._estop_label.pack()
+
+        tk.Button(
+            self._estop_dialog,
+            text="OK",
+            font=('Arial', 11, 'bold'),
+            bg='#e74c3c', fg='white',
+            command=self._estop_dialog.withdraw
+        ).pack(pady=(0, 15))
+
     def load_model(self):
         """Load the enhanced LSTM model and scaler with detailed diagnostics"""
         print("🔍 LSTM Model Loading Diagnostics")
         print("=" * 50)
         
+        global TENSORFLOW_AVAILABLE
         try:
+            if TENSORFLOW_AVAILABLE is None:
+                TENSORFLOW_AVAILABLE = importlib.util.find_spec('tensorflow') is not None
             if TENSORFLOW_AVAILABLE:
                 from tensorflow.keras.models import load_model as tf_load_model
-                import os
                 
                 # Prioritize most recent and enhanced models
                 model_files = [
@@ -192,12 +512,15 @@ class EnhancedPredictiveMonitor:
                             print(f"   🔄 Loading scaler...")
                             with open(scaler_file, 'rb') as f:
                                 self.scaler = pickle.load(f)
+                            self._cache_scaler_params()
                             
                             self.model_loaded = True
                             print(f"   ✅ SUCCESS! LSTM Model loaded successfully")
                             print(f"   📊 Model input shape: {self.model.input_shape}")
                             print(f"   📊 Model output shape: {self.model.output_shape}")
                             print(f"   🧠 Using LSTM for REAL failure predictions!")
+                            self._build_infer_fn()
+                            self._init_tflite(model_file)
                             print("=" * 50)
                             return  # Exit on first successful load
                             
@@ -222,6 +545,119 @@ class EnhancedPredictiveMonitor:
             
         print("=" * 50)
     
+    def _cache_scaler_params(self):
+        """Cache StandardScaler constants for inline scaling on the hot path"""
+        if hasattr(self.scaler, 'mean_'):
+            self._scaler_mean = np.asarray(self.scaler.mean_, dtype=np.float32)
+            self._scaler_inv_scale = 1.0 / np.asarray(self.scaler.scale_, dtype=np.float32)
+
+    def _scale(self, x):
+        """Inline (x - mean) * (1/scale) broadcast, no sklearn dispatch"""
+        if self._scaler_mean is None:
+            return self.scaler.transform(x)
+        return (x - self._scaler_mean) * self._scaler_inv_scale
+
+    def _representative_dataset(self):
+        """Random in-range windows, scaled like live data, for quantization calibration"""
+        lows = self.P['min']
+        highs = self.P['max']
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            seq = rng.uniform(lows, highs, size=(self.sequence_length, 6))
+            scaled = self.scaler.transform(seq).astype(np.float32)
+            yield [scaled.reshape(1, self.sequence_length, 6)]
+
+    def _init_tflite(self, model_file):
+        """Convert the Keras model to int8 TFLite once and load the interpreter"""
+        try:
+            import tensorflow as tf
+
+            tflite_file = model_file.replace('.h5', '_int8.tflite')
+            if not os.path.exists(tflite_file):
+                converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+                converter.optimizations = [tf.lite.Optimize.DEFAULT]
+                converter.representative_dataset = self._representative_dataset
+                converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+                converter.inference_input_type = tf.int8
+                converter.inference_output_type = tf.int8
+                with open(tflite_file, 'wb') as f:
+                    f.write(converter.convert())
+                print(f"   ✅ Converted model to int8 TFLite: {tflite_file}")
+
+            self.interpreter = tf.lite.Interpreter(model_path=tflite_file, num_threads=2)
+            self.interpreter.allocate_tensors()
+            self._in_detail = self.interpreter.get_input_details()[0]
+            self._out_details = self.interpreter.get_output_details()
+
+            # get_output_details() order is not guaranteed to match the
+            # Keras head order, so resolve each detail to its head by tensor
+            # name, falling back to the head's output width; refuse the
+            # interpreter outright rather than risk crossed outputs
+            self._out_heads = None
+            if len(self._out_details) > 1:
+                widths = {'health_classification': 3,
+                          'failure_prediction': 6,
+                          'time_to_failure': 1}
+                mapping = {}
+                for out in self._out_details:
+                    head = next((h for h in widths if h in out['name']), None)
+                    if head is None:
+                        head = next((h for h, w in widths.items()
+                                     if w == out['shape'][-1] and h not in mapping),
+                                    None)
+                    if head is None or head in mapping:
+                        raise RuntimeError(
+                            f"cannot map TFLite output {out['name']!r} to a model head")
+                    mapping[head] = out
+                if 'health_classification' not in mapping:
+                    raise RuntimeError("TFLite outputs lack a health head")
+                self._out_heads = mapping
+            print(f"   ⚡ TFLite int8 interpreter active - Keras predict off the hot path")
+        except Exception as e:
+            self.interpreter = None
+            print(f"   ⚠️ TFLite unavailable ({str(e)[:80]}) - keeping Keras predict")
+
+    def _build_infer_fn(self):
+        """Trace model.__call__ as a tf.function locked to the (1, seq, 6) shape
+
+        model.predict pays Python dispatch, callback and progbar setup on
+        every call, which dwarfs the graph time at batch size 1; the traced
+        callable skips all of it and retraces never.
+        """
+        try:
+            import tensorflow as tf
+            self._infer = tf.function(
+                lambda x: self.model(x, training=False),
+                input_signature=[tf.TensorSpec((1, self.sequence_length, 6), tf.float32)],
+            )
+        except Exception as e:
+            self._infer = None
+            print(f"   ⚠️ tf.function wrap failed ({str(e)[:80]}) - keeping model.predict")
+
+    def _predict_tflite(self, X):
+        """Run one window through the int8 TFLite interpreter"""
+        detail = self._in_detail
+        x = np.asarray(X, dtype=np.float32)
+        if detail['dtype'] == np.int8:
+            scale, zero_point = detail['quantization']
+            x = np.clip(np.round(x / scale + zero_point), -128, 127).astype(np.int8)
+        self.interpreter.set_tensor(detail['index'], x)
+        self.interpreter.invoke()
+
+        def dequant(out):
+            y = self.interpreter.get_tensor(out['index'])
+            if out['dtype'] == np.int8:
+                o_scale, o_zero = out['quantization']
+                y = (y.astype(np.float32) - o_zero) * o_scale
+            return y
+
+        # Multi-head models return a dict keyed by head name via the map
+        # built at load time - never positional, the tensor order is not
+        # the Keras head order
+        if self._out_heads is not None:
+            return {head: dequant(out) for head, out in self._out_heads.items()}
+        return dequant(self._out_details[0])
+
     def setup_gui(self):
         """Setup the enhanced GUI interface"""
         # Main title
@@ -264,7 +700,21 @@ class EnhancedPredictiveMonitor:
         
         self.setup_control_panel(left_panel)
         self.setup_status_panel(center_panel)
-        self.setup_maintenance_panel(right_panel)
+
+        # The maintenance panel is roughly a third of the startup widget
+        # count; build it lazily on first reveal instead of before mainloop
+        self._maint_placeholder = right_panel
+        self._maint_button = tk.Button(
+            right_panel, text="🔧 Show Maintenance Insights",
+            font=('Arial', 11, 'bold'), bg='#8e44ad', fg='white',
+            command=self._lazy_build_maint, relief='raised', bd=3
+        )
+        self._maint_button.pack(expand=True)
+
+    def _lazy_build_maint(self):
+        """Build the maintenance panel widgets on first reveal"""
+        self._maint_button.destroy()
+        self.setup_maintenance_panel(self._maint_placeholder)
     
     def setup_control_panel(self, parent):
         """Setup the control panel with sliders and monitoring controls"""
@@ -276,11 +726,24 @@ class EnhancedPredictiveMonitor:
         title_label.pack(pady=(10, 20))
         
         # Timer display
+        self.timer_var = tk.StringVar(value="⏱️ Timer: 00:00 | Points: 0 | Buffer: 0/10")
         self.timer_label = tk.Label(
-            parent, text="⏱️ Timer: 00:00 | Points: 0 | Buffer: 0/10", 
+            parent, textvariable=self.timer_var, 
             font=('Arial', 10, 'bold'), bg='#ecf0f1', fg='#8e44ad'
         )
-        self.timer_label.pack(pady=(0, 15))
+        self.timer_label.pack(pady=(0, 5))
+        
+        # All six status dots live on one shared Canvas; updates are
+        # itemconfigure calls on text items instead of per-Label configures
+        self._status_canvas = tk.Canvas(
+            parent, height=22, width=len(self.parameters) * 24,
+            bg='#ecf0f1', highlightthickness=0
+        )
+        self._status_canvas.pack(pady=(0, 10))
+        for i, name in enumerate(self._param_order):
+            self._status_ids[name] = self._status_canvas.create_text(
+                i * 24 + 12, 11, text="⚪", font=('Arial', 12)
+            )
         
         # Control buttons
         button_frame = tk.Frame(parent, bg='#ecf0f1')
@@ -321,7 +784,10 @@ class EnhancedPredictiveMonitor:
             relief='raised',
             bd=2
         )
-        scrollable_frame = tk.Frame(canvas, bg='#ecf0f1')
+        # Background for the whole slider area resolved once through the
+        # option database instead of a bg= argument on every child widget
+        self.root.option_add('*sensorsliders*background', '#ecf0f1')
+        scrollable_frame = tk.Frame(canvas, bg='#ecf0f1', name='sensorsliders')
         
         # Store references for manual updates
         self.sensor_canvas = canvas
@@ -335,15 +801,25 @@ class EnhancedPredictiveMonitor:
         canvas.pack(side="left", fill="both", expand=True)
         slider_scrollbar.pack(side="right", fill="y")
         
-        # Configure scrollable region - FIXED VERSION
-        def configure_scroll_region(event=None):
-            """Update scroll region when scrollable frame changes"""
+        # Configure scrollable region - coalesced so the bbox recompute runs
+        # once per idle flush instead of once per child <Configure> during
+        # startup, when every created widget fires the event
+        self._scroll_pending = False
+
+        def _do_scroll_reconf():
+            """Recompute the scroll region and canvas window width once"""
+            self._scroll_pending = False
             canvas.configure(scrollregion=canvas.bbox("all"))
-            # Update canvas window width to match canvas width
             canvas_width = canvas.winfo_width()
             if canvas_width > 1:  # Ensure canvas is initialized
                 canvas.itemconfig(canvas_window, width=canvas_width - 20)  # Account for scrollbar
         
+        def configure_scroll_region(event=None):
+            """Schedule one scroll-region update per idle flush"""
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                canvas.after_idle(_do_scroll_reconf)
+        
         def configure_canvas_size(event):
             """Update canvas window size when canvas is resized"""
             canvas_width = event.width
@@ -354,106 +830,85 @@ class EnhancedPredictiveMonitor:
         scrollable_frame.bind("<Configure>", configure_scroll_region)
         canvas.bind('<Configure>', configure_canvas_size)
         
-        # Enhanced mousewheel binding - IMPROVED VERSION
+        # Wheel events bound straight on the scroll widgets - Tk already
+        # delivers them to the widget under the pointer, so no bind_all /
+        # unbind_all churn on every Enter/Leave and no winfo_containing probe
         def _on_mousewheel(event):
             """Handle mouse wheel scrolling"""
-            try:
-                # Check if mouse is over the canvas or scrollable frame
-                widget_under_mouse = canvas.winfo_containing(event.x_root, event.y_root)
-                if widget_under_mouse in [canvas] or str(widget_under_mouse).startswith(str(scrollable_frame)):
-                    canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            except:
-                pass  # Ignore errors during scrolling
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         
-        def _bind_mousewheel(event):
-            """Bind mouse wheel when entering scroll area"""
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def _on_scroll_up(event):
+            canvas.yview_scroll(-1, "units")
         
-        def _unbind_mousewheel(event):
-            """Unbind mouse wheel when leaving scroll area"""
-            canvas.unbind_all("<MouseWheel>")
+        def _on_scroll_down(event):
+            canvas.yview_scroll(1, "units")
         
-        # Bind mouse wheel events to multiple widgets for better coverage
-        for widget in [canvas, scrollable_frame, sliders_main_frame]:
-            widget.bind('<Enter>', _bind_mousewheel)
-            widget.bind('<Leave>', _unbind_mousewheel)
+        for widget in (canvas, scrollable_frame):
+            widget.bind("<MouseWheel>", _on_mousewheel)
+            widget.bind("<Button-4>", _on_scroll_up)    # X11 wheel up
+            widget.bind("<Button-5>", _on_scroll_down)  # X11 wheel down
         
-        # Create parameter sliders
+        # Create parameter sliders - one tight loop, backgrounds from the
+        # option database, and the ranges column drawn on a single Canvas
+        # (three text items) instead of a Frame plus three Labels each
         for param_name, config in self.parameters.items():
             # Parameter container
-            param_container = tk.Frame(scrollable_frame, bg='#ecf0f1', relief='groove', bd=1)
+            param_container = tk.Frame(scrollable_frame, relief='groove', bd=1)
             param_container.pack(fill='x', pady=8, padx=5)
             
-            # Parameter header
-            header_frame = tk.Frame(param_container, bg='#ecf0f1')
-            header_frame.pack(fill='x', padx=10, pady=5)
-            
             # Parameter name with status indicator
-            name_frame = tk.Frame(header_frame, bg='#ecf0f1')
-            name_frame.pack(fill='x')
-            
-            status_indicator = tk.Label(
-                name_frame, text="⚪", font=('Arial', 12), bg='#ecf0f1'
-            )
-            status_indicator.pack(side='left')
-            self.status_displays[param_name] = status_indicator
+            name_frame = tk.Frame(param_container)
+            name_frame.pack(fill='x', padx=10, pady=5)
             
             param_label = tk.Label(
                 name_frame, text=f"{param_name.replace('_', ' ')}:", 
-                font=('Arial', 10, 'bold'), bg='#ecf0f1', fg='#2c3e50'
+                font=('Arial', 10, 'bold'), fg='#2c3e50'
             )
             param_label.pack(side='left', padx=(5, 0))
             
-            # Current value display
+            # Current value display - text routed through a StringVar, the
+            # cheaper Tcl path than a configure call per update
+            value_var = tk.StringVar(value=f"{config['default']:.1f} {config['unit']}")
             value_label = tk.Label(
-                name_frame, text=f"{config['default']:.1f} {config['unit']}", 
-                font=('Arial', 10), bg='#ecf0f1', fg='#e74c3c'
+                name_frame, textvariable=value_var, 
+                font=('Arial', 10), fg='#e74c3c'
             )
             value_label.pack(side='right')
             self.value_labels[param_name] = value_label
+            self.value_vars[param_name] = value_var
             
             # Slider
             slider = tk.Scale(
                 param_container, from_=config['min'], to=config['max'],
                 orient='horizontal', resolution=0.1 if config['max'] < 100 else 1,
-                length=320, bg='#ecf0f1', fg='#2c3e50',
-                command=lambda val, name=param_name: self.update_value_label(name, val)
+                length=320, fg='#2c3e50',
+                command=lambda val, name=param_name: self._queue_slider_update(name, val)
             )
             slider.set(config['default'])
             slider.pack(padx=10, pady=(0, 5))
             self.sliders[param_name] = slider
             
-            # Optimal range indicator
+            # Optimal/warning/critical ranges as canvas text items
             pattern = self.failure_patterns[param_name]
-            
-            # Create a frame for ranges display
-            ranges_frame = tk.Frame(param_container, bg='#ecf0f1')
-            ranges_frame.pack(fill='x', padx=10, pady=(0, 5))
-            
-            # Optimal range
-            optimal_text = f"🟢 Optimal: {pattern['optimal_low']}-{pattern['optimal_high']} {config['unit']}"
-            optimal_label = tk.Label(
-                ranges_frame, text=optimal_text, font=('Arial', 8, 'bold'),
-                bg='#ecf0f1', fg='#27ae60'
+            ranges_canvas = tk.Canvas(param_container, height=48, highlightthickness=0)
+            ranges_canvas.pack(fill='x', padx=10, pady=(0, 5))
+            ranges_canvas.create_text(
+                4, 8, anchor='w', fill='#27ae60', font=('Arial', 8, 'bold'),
+                text=f"🟢 Optimal: {pattern['optimal_low']}-{pattern['optimal_high']} {config['unit']}"
             )
-            optimal_label.pack(anchor='w')
-            
-            # Warning range
-            warning_text = f"🟡 Warning: {pattern['warning_low']}-{pattern['warning_high']} {config['unit']}"
-            warning_label = tk.Label(
-                ranges_frame, text=warning_text, font=('Arial', 8),
-                bg='#ecf0f1', fg='#f39c12'
+            ranges_canvas.create_text(
+                4, 24, anchor='w', fill='#f39c12', font=('Arial', 8),
+                text=f"🟡 Warning: {pattern['warning_low']}-{pattern['warning_high']} {config['unit']}"
             )
-            warning_label.pack(anchor='w')
-            
-            # Critical range
-            critical_text = f"🔴 Critical: <{pattern['critical_low']} or >{pattern['critical_high']} {config['unit']}"
-            critical_label = tk.Label(
-                ranges_frame, text=critical_text, font=('Arial', 8),
-                bg='#ecf0f1', fg='#e74c3c'
+            ranges_canvas.create_text(
+                4, 40, anchor='w', fill='#e74c3c', font=('Arial', 8),
+                text=f"🔴 Critical: <{pattern['critical_low']} or >{pattern['critical_high']} {config['unit']}"
             )
-            critical_label.pack(anchor='w')
         
+        # Slider widgets in parameter order - get_current_values iterates
+        # this tuple instead of rebuilding the key list per call
+        self._sliders_seq = tuple(self.sliders[p] for p in self._param_order)
+
         # Force scroll region update after all sliders are created
         def update_scroll_after_creation():
             """Update scroll region after all widgets are created"""
@@ -492,9 +947,28 @@ class EnhancedPredictiveMonitor:
         status_frame = tk.Frame(parent, bg='#ecf0f1')
         status_frame.pack(fill='x', padx=15, pady=10)
         
+        self._status_frame = status_frame
+
+        # Reusable in-panel WARNING banner - shown/hidden with pack/pack_forget
+        # instead of building a Toplevel per warning event
+        self.warning_banner = tk.Frame(parent, bg='#f39c12', relief='ridge', bd=2)
+        self.warning_banner_label = tk.Label(
+            self.warning_banner, text="",
+            font=('Arial', 11, 'bold'), bg='#f39c12', fg='white',
+            justify='left', padx=10, pady=5
+        )
+        self.warning_banner_label.pack(side='left', fill='x', expand=True)
+        tk.Button(
+            self.warning_banner, text="Dismiss",
+            font=('Arial', 9, 'bold'), bg='#e67e22', fg='white',
+            command=self._dismiss_warning_banner
+        ).pack(side='right', padx=10, pady=5)
+        self._warning_alert_id = None
+
         # Main status
+        self.status_var = tk.StringVar(value="🟢 SYSTEM READY")
         self.main_status_label = tk.Label(
-            status_frame, text="🟢 SYSTEM READY", 
+            status_frame, textvariable=self.status_var, 
             font=('Arial', 20, 'bold'), bg='#ecf0f1', fg='#27ae60'
         )
         self.main_status_label.pack(pady=10)
@@ -503,14 +977,16 @@ class EnhancedPredictiveMonitor:
         metrics_frame = tk.Frame(status_frame, bg='#ecf0f1')
         metrics_frame.pack(fill='x', pady=5)
         
+        self.confidence_var = tk.StringVar(value="Confidence: N/A")
         self.confidence_label = tk.Label(
-            metrics_frame, text="Confidence: N/A", 
+            metrics_frame, textvariable=self.confidence_var, 
             font=('Arial', 12), bg='#ecf0f1', fg='#34495e'
         )
         self.confidence_label.pack(side='left')
         
+        self.ttf_var = tk.StringVar(value="Time to Failure: N/A")
         self.ttf_label = tk.Label(
-            metrics_frame, text="Time to Failure: N/A", 
+            metrics_frame, textvariable=self.ttf_var, 
             font=('Arial', 12), bg='#ecf0f1', fg='#34495e'
         )
         self.ttf_label.pack(side='right')
@@ -530,7 +1006,7 @@ class EnhancedPredictiveMonitor:
         self.analysis_display = tk.Text(
             text_frame, height=25, width=60,
             font=('Consolas', 9), bg='#2c3e50', fg='#ecf0f1',
-            wrap=tk.WORD, state='normal',
+            wrap=tk.WORD, state='disabled',
             relief='flat', bd=0
         )
         
@@ -586,7 +1062,7 @@ class EnhancedPredictiveMonitor:
 🎯 Status: Ready for INSTANT monitoring...
    Adjust sliders to see IMMEDIATE predictions and alerts!
 """
-        self.analysis_display.insert(tk.END, initial_msg)
+        self.log(initial_msg)
     
     def setup_maintenance_panel(self, parent):
         """Setup the maintenance recommendations panel"""
@@ -726,69 +1202,65 @@ class EnhancedPredictiveMonitor:
         )
         maint_scroll_hint.pack(pady=(0, 5))
     
+    def _queue_slider_update(self, param_name, value):
+        """Coalesce slider command callbacks into one idle-time flush"""
+        self._pending_slider[param_name] = value
+        if not self._slider_flush_scheduled:
+            self._slider_flush_scheduled = True
+            self.root.after_idle(self._flush_slider_updates)
+
+    def _flush_slider_updates(self):
+        """Apply the newest queued value per parameter, then predict once"""
+        self._slider_flush_scheduled = False
+        pending, self._pending_slider = self._pending_slider, {}
+        for param_name, value in pending.items():
+            self.update_value_label(param_name, value)
+        # One prediction per flushed burst, not one per dirty parameter -
+        # the snapshot covers every slider anyway
+        if pending and self.is_monitoring:
+            last_param = next(reversed(pending))
+            self.trigger_immediate_prediction(last_param, pending[last_param])
+
     def update_value_label(self, param_name, value):
-        """Update parameter value label with color coding and IMMEDIATE failure detection"""
-        config = self.parameters[param_name]
-        pattern = self.failure_patterns[param_name]
-        
-        self.value_labels[param_name].config(text=f"{float(value):.1f} {config['unit']}")
-        
-        # Color coding and status indicator - CORRECTED LOGIC
+        """Update parameter value label with color coding via bucket lookup"""
+        i = self._param_idx[param_name]
         val = float(value)
-        if pattern['optimal_low'] <= val <= pattern['optimal_high']:
-            # Optimal range - GREEN
-            self.value_labels[param_name].config(fg='#27ae60')
-            self.status_displays[param_name].config(text="🟢", fg='#27ae60')
-        elif (pattern['warning_low'] <= val < pattern['optimal_low']) or (pattern['optimal_high'] < val <= pattern['warning_high']):
-            # Warning range (between warning and optimal) - YELLOW
-            self.value_labels[param_name].config(fg='#f39c12')
-            self.status_displays[param_name].config(text="🟡", fg='#f39c12')
-        else:
-            # Critical range (outside warning range) - RED
-            self.value_labels[param_name].config(fg='#e74c3c')
-            self.status_displays[param_name].config(text="🔴", fg='#e74c3c')
-        
-        # ✅ IMMEDIATE FAILURE DETECTION: Trigger instant prediction when parameter crosses range
-        if self.is_monitoring:
-            self.trigger_immediate_prediction(param_name, val)
+
+        text = self._fmt[param_name](val)
+        if self._last_text.get(param_name) != text:
+            self._last_text[param_name] = text
+            self.value_vars[param_name].set(text)
+
+        # Branchless range classification - the bucket index maps straight
+        # onto critical/warning/optimal/warning/critical styling
+        state = int(np.searchsorted(self._buckets[i], val, side='right'))
+        if self._last_state.get(param_name) != state:
+            self._last_state[param_name] = state
+            color = self._state_colors[state]
+            self.value_labels[param_name].config(fg=color)
+            self._status_canvas.itemconfigure(
+                self._status_ids[param_name], text=self._state_icons[state], fill=color
+            )
     
     def trigger_immediate_prediction(self, changed_param, new_value):
         """🚀 INSTANT PREDICTION: Trigger immediate failure detection when parameter changes"""
         try:
-            print(f"⚡ INSTANT CHECK: {changed_param} = {new_value:.1f}")
+            _log.debug("⚡ INSTANT CHECK: %s = %.1f", changed_param, new_value)
             
             # Get current values for all parameters
             current_values = self.get_current_values()
-            current_time = datetime.now()
+            current_time = time.monotonic()
             
             # Add to sensor history immediately
-            self.sensor_history.append(current_values)
+            self._append_sample(current_values)
             self.timestamps.append(current_time)
             
-            # Keep buffer size manageable
-            if len(self.sensor_history) > self.sequence_length:
-                self.sensor_history = self.sensor_history[-self.sequence_length:]
-                self.timestamps = self.timestamps[-self.sequence_length:]
-            
-            # ✅ INSTANT PREDICTION: Don't wait for buffer - predict immediately
-            result = self.predict_health(self.sensor_history)
+            # ✅ INSTANT PREDICTION: hand the window to the inference worker
+            # instead of blocking the Tk thread on model.predict; the result
+            # renders (and alerts) via _apply_prediction
+            self._submit_inference(self._last_sequence(), current_values)
+            self.data_points_recorded += 1
             
-            if result:
-                # Update displays immediately
-                self.update_displays(result, current_values)
-                
-                # ✅ INSTANT ALERTS: Show immediate alerts for critical conditions
-                if result['predicted_status'] == 'CRITICAL':
-                    print(f"🚨 INSTANT CRITICAL ALERT: {changed_param} triggered critical status")
-                    self.emergency_alert(result)
-                elif result['predicted_status'] == 'WARNING' and result['confidence'] > 0.6:
-                    print(f"⚠️ INSTANT WARNING ALERT: {changed_param} triggered warning status") 
-                    self.emergency_alert(result)
-                
-                # Update data points counter
-                self.data_points_recorded += 1
-                self.update_timer()
-                
         except Exception as e:
             print(f"❌ Instant prediction error: {e}")
     
@@ -798,13 +1270,13 @@ class EnhancedPredictiveMonitor:
             if self.sensor_canvas and self.sensor_scrollable_frame:
                 self.sensor_scrollable_frame.update_idletasks()
                 self.sensor_canvas.configure(scrollregion=self.sensor_canvas.bbox("all"))
-                print("✅ Sensor scroll region updated")
+                _log.debug("✅ Sensor scroll region updated")
         except Exception as e:
             print(f"⚠️ Error updating scroll region: {e}")
     
     def get_current_values(self):
         """Get current slider values"""
-        return [self.sliders[param].get() for param in self.parameters.keys()]
+        return [s.get() for s in self._sliders_seq]
     
     def predict_health(self, sensor_data):
         """Enhanced health prediction with LSTM or simulation fallback - OPTIMIZED for immediate predictions"""
@@ -815,80 +1287,93 @@ class EnhancedPredictiveMonitor:
                 if len(sensor_data) >= self.sequence_length:
                     # Full buffer - use complete sequence
                     recent_data = np.array(sensor_data[-self.sequence_length:])
-                    print(f"🧠 Using LSTM with FULL buffer ({len(sensor_data)} points)")
+                    _log.debug("🧠 Using LSTM with FULL buffer (%d points)", len(sensor_data))
                 else:
-                    # Partial buffer - pad with last known values for immediate prediction
-                    available_data = np.array(sensor_data)
-                    last_reading = available_data[-1]
-                    
-                    # Pad sequence by repeating the last reading
+                    # Partial buffer - repeat the last reading into the head
+                    # of a preallocated window (broadcast assignment, no
+                    # tile/vstack allocations while the buffer warms up)
+                    available_data = np.asarray(sensor_data, dtype=np.float32)
                     padding_needed = self.sequence_length - len(available_data)
-                    padding = np.tile(last_reading, (padding_needed, 1))
-                    recent_data = np.vstack([padding, available_data])
-                    
-                    print(f"🚀 Using LSTM with PADDED buffer ({len(sensor_data)} real + {padding_needed} padded points)")
-                
-                # Scale the data
-                scaled_data = self.scaler.transform(recent_data)
+                    self._pad_buf[:padding_needed] = available_data[-1]
+                    self._pad_buf[padding_needed:] = available_data
+                    recent_data = self._pad_buf
+
+                    _log.debug("🚀 Using LSTM with PADDED buffer (%d real + %d padded points)", len(sensor_data), padding_needed)
                 
-                # Reshape for LSTM [batch_size, sequence_length, features]
-                X = scaled_data.reshape(1, self.sequence_length, 6)
+                # Scale straight into the reusable input tensor - inline
+                # broadcast beats scaler.transform's validation, and writing
+                # in place skips the per-tick reshape allocation
+                X = self._X
+                if self._scaler_mean is None:
+                    X[0] = self.scaler.transform(recent_data)
+                else:
+                    np.subtract(recent_data, self._scaler_mean, out=X[0])
+                    np.multiply(X[0], self._scaler_inv_scale, out=X[0])
                 
-                # Make LSTM prediction
-                predictions = self.model.predict(X, verbose=0)
+                # Make LSTM prediction - int8 TFLite when available, with
+                # Keras predict as the fallback
+                if self.interpreter is not None:
+                    predictions = self._predict_tflite(X)
+                elif self._infer is not None:
+                    raw = self._infer(X)
+                    if isinstance(raw, dict):
+                        predictions = {k: v.numpy() for k, v in raw.items()}
+                    elif isinstance(raw, (list, tuple)):
+                        predictions = [v.numpy() for v in raw]
+                    else:
+                        predictions = raw.numpy()
+                else:
+                    predictions = self.model.predict(X, verbose=0)
                 
-                # Extract predictions based on model architecture
+                # Extract predictions based on model architecture - missing
+                # heads fall back to the deterministic per-class fillers
                 if isinstance(predictions, dict):
                     # Enhanced multi-output model
                     health_pred = predictions['health_classification'][0]
-                    failure_pred = predictions.get('failure_prediction', [np.random.random(6)])[0]
-                    ttf_pred = predictions.get('time_to_failure', [np.random.uniform(10, 100)])[0][0] if len(predictions.get('time_to_failure', [[0]])[0]) > 0 else np.random.uniform(10, 100)
+                    health_class, confidence = _classify_head(np.ascontiguousarray(health_pred, dtype=np.float32))
+                    ttf_out = predictions.get('time_to_failure')
+                    failure_pred = (predictions['failure_prediction'][0]
+                                    if 'failure_prediction' in predictions
+                                    else self._fake_fail[health_class])
+                    ttf_pred = (ttf_out[0][0]
+                                if ttf_out is not None and len(ttf_out[0]) > 0
+                                else self._fake_ttf[health_class])
                 elif isinstance(predictions, list) and len(predictions) > 1:
                     # Multiple outputs as list
                     health_pred = predictions[0][0]
-                    failure_pred = predictions[1][0] if len(predictions) > 1 else np.random.random(6)
-                    ttf_pred = predictions[2][0][0] if len(predictions) > 2 else np.random.uniform(10, 100)
+                    health_class, confidence = _classify_head(np.ascontiguousarray(health_pred, dtype=np.float32))
+                    failure_pred = predictions[1][0]
+                    ttf_pred = (predictions[2][0][0] if len(predictions) > 2
+                                else self._fake_ttf[health_class])
                 else:
                     # Single output - health classification only
                     health_pred = predictions[0]
-                    # Generate reasonable failure predictions based on health
-                    health_class = np.argmax(health_pred)
-                    if health_class == 2:  # Critical
-                        failure_pred = np.random.uniform(0.7, 0.9, 6)  # High failure risk
-                    elif health_class == 1:  # Warning
-                        failure_pred = np.random.uniform(0.3, 0.7, 6)  # Medium failure risk
-                    else:  # Healthy
-                        failure_pred = np.random.uniform(0.05, 0.3, 6)  # Low failure risk
-                    
-                    ttf_pred = 8 if health_class == 2 else 48 if health_class == 1 else 120
-                
-                # Health classification
-                health_class = np.argmax(health_pred)
-                confidence = np.max(health_pred)
+                    health_class, confidence = _classify_head(np.ascontiguousarray(health_pred, dtype=np.float32))
+                    failure_pred = self._fake_fail[health_class]
+                    ttf_pred = self._fake_ttf[health_class]
                 
-                status_map = {0: "HEALTHY", 1: "WARNING", 2: "CRITICAL"}
-                predicted_status = status_map[health_class]
+                predicted_status = _STATUS_NAMES[health_class]
                 
                 buffer_status = "FULL" if len(sensor_data) >= self.sequence_length else "PADDED"
-                print(f"🎯 LSTM Prediction ({buffer_status}): {predicted_status} (confidence: {confidence:.1%})")
+                _log.debug("🎯 LSTM Prediction (%s): %s (confidence: %.1f%%)", buffer_status, predicted_status, confidence * 100)
                 
                 return {
                     'predicted_status': predicted_status,
                     'predicted_class': health_class,
                     'confidence': confidence,
-                    'health_probabilities': health_pred.tolist(),
-                    'failure_predictions': failure_pred.tolist(),
+                    'health_probabilities': health_pred,
+                    'failure_predictions': failure_pred,
                     'time_to_failure': max(1, float(ttf_pred)),  # Ensure positive
-                    'timestamp': datetime.now(),
+                    'timestamp': time.monotonic(),
                     'model_type': f'🧠 Enhanced LSTM (AI-{buffer_status})'
                 }
             
             # ⚠️ FALLBACK: Use simulation when LSTM unavailable
             else:
                 if not self.model_loaded:
-                    print("⚠️  USING SIMULATION MODE - No LSTM predictions!")
+                    _log.debug("⚠️  USING SIMULATION MODE - No LSTM predictions!")
                 else:
-                    print(f"⚠️  USING SIMULATION MODE - Insufficient data buffer ({len(sensor_data)} < 3)")
+                    _log.debug("⚠️  USING SIMULATION MODE - Insufficient data buffer (%d < 3)", len(sensor_data))
                     
                 return self.simulate_prediction(sensor_data)
                 
@@ -899,33 +1384,22 @@ class EnhancedPredictiveMonitor:
     
     def simulate_prediction(self, sensor_data):
         """⚠️ SIMULATION MODE: Rule-based predictions when LSTM unavailable"""
-        print("📊 Using RULE-BASED simulation (NOT AI predictions)")
+        _log.debug("📊 Using RULE-BASED simulation (NOT AI predictions)")
         
-        if not sensor_data:
+        if len(sensor_data) == 0:
             return None
         
-        current_values = sensor_data[-1] if len(sensor_data) > 0 else [28, 65, 120, 2200, 15, 225]
-        param_names = list(self.parameters.keys())
-        
-        issues = []
-        failure_predictions = []
-        critical_params = 0
-        warning_params = 0
+        current_values = sensor_data[-1]
+        param_names = self._param_order
         
         # ✅ MODIFIED LOGIC: Any parameter outside optimal range = CRITICAL
-        # Rule-based analysis using hardcoded thresholds
-        for i, value in enumerate(current_values):
-            param_name = param_names[i]
-            pattern = self.failure_patterns[param_name]
-            
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                # Optimal range - hardcoded low failure probability
-                failure_predictions.append(0.02)  # HARDCODED percentage
-            else:
-                # ✅ CRITICAL: ANY parameter outside optimal range triggers critical status
-                issues.append(param_name)
-                failure_predictions.append(0.85)  # HARDCODED percentage
-                critical_params += 1
+        # Compiled kernel scores the whole vector in one native call
+        values = np.asarray(current_values, dtype=np.float32)
+        failure_arr = np.empty(values.shape[0], dtype=np.float32)
+        critical_params = _simulate_health(values, self.P['ol'], self.P['oh'], failure_arr)
+        issues = [param_names[i] for i in np.nonzero(failure_arr > 0.5)[0]]
+        failure_predictions = failure_arr
+        warning_params = 0
         
         # ✅ SIMPLIFIED LOGIC: Any non-optimal parameter = CRITICAL
         if critical_params > 0:
@@ -939,7 +1413,7 @@ class EnhancedPredictiveMonitor:
             confidence = 0.95  # HARDCODED confidence
             ttf = 120.0  # HARDCODED time to failure
         
-        print(f"⚠️  RULE-BASED Result: {status} (hardcoded logic)")
+        _log.debug("⚠️  RULE-BASED Result: %s (hardcoded logic)", status)
         
         return {
             'predicted_status': status,
@@ -949,7 +1423,7 @@ class EnhancedPredictiveMonitor:
                                    [0.15, 0.80, 0.05] if health_class == 1 else [0.05, 0.15, 0.80],
             'failure_predictions': failure_predictions,
             'time_to_failure': ttf,
-            'timestamp': datetime.now(),
+            'timestamp': time.monotonic(),
             'model_type': '⚠️ SIMULATION (Rule-based)',
             'issues': issues,
             'critical_params': critical_params,
@@ -958,44 +1432,43 @@ class EnhancedPredictiveMonitor:
     
     def analyze_failure_reasons(self, current_values, failure_predictions):
         """Analyze specific failure reasons for each parameter - FIXED to prevent false warnings"""
-        param_names = list(self.parameters.keys())
+        # One vectorized pass over the threshold arrays replaces the
+        # six-way Python loop; only out-of-optimal parameters are visited
+        vals = np.asarray(current_values, dtype=np.float32)
+        below_opt = vals < self.P['ol']
+        out_opt = below_opt | (vals > self.P['oh'])
+        if not out_opt.any():
+            return []
+
+        crit = (vals < self.P['cl']) | (vals > self.P['ch'])
+        warn = ((self.P['wl'] <= vals) & below_opt) | \
+               ((vals > self.P['oh']) & (vals <= self.P['wh']))
+
         failure_analysis = []
-        
-        for i, (param_name, failure_prob) in enumerate(zip(param_names, failure_predictions)):
+        for i in np.nonzero(out_opt)[0]:
+            param_name = self._param_order[i]
             value = current_values[i]
-            pattern = self.failure_patterns[param_name]
-            
-            # ✅ FIXED: Only analyze parameters that are ACTUALLY outside optimal range
-            # This prevents showing multiple warnings when only one parameter is changed
-            if not (pattern['optimal_low'] <= value <= pattern['optimal_high']):
-                # Parameter is actually outside optimal range
-                if value < pattern['critical_low'] or value > pattern['critical_high']:
-                    # Critical range
-                    if value < pattern['critical_low']:
-                        reason = pattern['failure_reasons']['low']
-                    else:
-                        reason = pattern['failure_reasons']['high']
-                    severity = "HIGH"
-                elif (pattern['warning_low'] <= value < pattern['optimal_low']) or (pattern['optimal_high'] < value <= pattern['warning_high']):
-                    # Warning range (between warning and optimal)
-                    if value < pattern['optimal_low']:
-                        reason = pattern['failure_reasons']['low']
-                    else:
-                        reason = pattern['failure_reasons']['high']
-                    severity = "MEDIUM"
-                else:
-                    # Edge case - between critical and warning
-                    reason = "Parameter in transitional range - monitor closely"
-                    severity = "MEDIUM"
-                
-                failure_analysis.append({
-                    'parameter': param_name,
-                    'value': value,
-                    'failure_probability': failure_prob,
-                    'severity': severity,
-                    'reason': reason
-                })
-        
+            side = 'low' if below_opt[i] else 'high'
+
+            if crit[i]:
+                reason = self.failure_patterns[param_name]['failure_reasons'][side]
+                severity = "HIGH"
+            elif warn[i]:
+                reason = self.failure_patterns[param_name]['failure_reasons'][side]
+                severity = "MEDIUM"
+            else:
+                # Edge case - between critical and warning
+                reason = "Parameter in transitional range - monitor closely"
+                severity = "MEDIUM"
+
+            failure_analysis.append({
+                'parameter': param_name,
+                'value': value,
+                'failure_probability': failure_predictions[i],
+                'severity': severity,
+                'reason': reason
+            })
+
         return failure_analysis
     
     def generate_maintenance_recommendations(self, result, failure_analysis):
@@ -1077,16 +1550,20 @@ class EnhancedPredictiveMonitor:
     def update_displays(self, result, current_values):
         """Update all display panels with current analysis"""
         # Update main status
-        status_colors = {'HEALTHY': '#27ae60', 'WARNING': '#f39c12', 'CRITICAL': '#e74c3c'}
-        status_emojis = {'HEALTHY': '🟢', 'WARNING': '🟡', 'CRITICAL': '🔴'}
-        
         status = result['predicted_status']
-        emoji = status_emojis[status]
-        color = status_colors[status]
-        
-        self.main_status_label.config(text=f"{emoji} {status}", fg=color)
-        self.confidence_label.config(text=f"Confidence: {result['confidence']:.1%}")
-        
+        emoji = _STATUS_EMOJIS[status]
+        color = _STATUS_COLORS[status]
+
+        # Headline widgets only touch Tk when their content changed
+        if self._last_main_status != status:
+            self._last_main_status = status
+            self.status_var.set(f"{emoji} {status}")
+            self.main_status_label.config(fg=color)
+        conf_text = f"Confidence: {result['confidence']:.1%}"
+        if conf_text != self._last_conf_text:
+            self._last_conf_text = conf_text
+            self.confidence_var.set(conf_text)
+
         # Time to failure display
         ttf = result['time_to_failure']
         if ttf < 24:
@@ -1098,71 +1575,58 @@ class EnhancedPredictiveMonitor:
         else:
             ttf_text = f"Time to Failure: {ttf/24:.1f} days"
             ttf_color = '#27ae60'
-        
-        self.ttf_label.config(text=ttf_text, fg=ttf_color)
-        
-        # Analysis display
-        self.analysis_display.delete(1.0, tk.END)
-        
-        output = f"{'='*60}\n"
-        output += f"🧠 ENHANCED LSTM ANALYSIS\n"
-        output += f"{'='*60}\n"
-        output += f"Status: {emoji} {status}\n"
-        output += f"Confidence: {result['confidence']:.1%}\n"
-        output += f"Model: {result['model_type']}\n"
-        output += f"Time to Failure: {ttf:.1f} hours\n"
-        output += f"Timestamp: {result['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        # Health probabilities
-        output += f"🎯 HEALTH PROBABILITIES\n"
-        output += f"{'-'*30}\n"
-        health_labels = ['Healthy', 'Warning', 'Critical']
-        for i, (label, prob) in enumerate(zip(health_labels, result['health_probabilities'])):
-            output += f"{label}: {prob:.1%}\n"
-        
+
+        if self._last_ttf != (ttf_text, ttf_color):
+            self._last_ttf = (ttf_text, ttf_color)
+            self.ttf_var.set(ttf_text)
+            self.ttf_label.config(fg=ttf_color)
+        
+        # Analysis display - appended as a rolling log capped at
+        # _max_log_lines; built as a parts list so joins stay O(n)
+        parts = [
+            f"{_EQ60}\n🧠 ENHANCED LSTM ANALYSIS\n{_EQ60}\n"
+            f"Status: {emoji} {status}\n"
+            f"Confidence: {result['confidence']:.1%}\n"
+            f"Model: {result['model_type']}\n"
+            f"Time to Failure: {ttf:.1f} hours\n"
+            f"Timestamp: {self._now_str()}\n\n"
+            f"🎯 HEALTH PROBABILITIES\n{_DASH30}\n"
+        ]
+        health_labels = ('Healthy', 'Warning', 'Critical')
+        for label, prob in zip(health_labels, result['health_probabilities']):
+            parts.append(f"{label}: {prob:.1%}\n")
+
         # Current sensor readings
-        output += f"\n📊 CURRENT SENSOR READINGS\n"
-        output += f"{'-'*40}\n"
-        param_names = list(self.parameters.keys())
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            config = self.parameters[param_name]
-            pattern = self.failure_patterns[param_name]
-            
-            # Status indicator - CORRECTED LOGIC
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status_icon = "🟢"
-            elif (pattern['warning_low'] <= value < pattern['optimal_low']) or (pattern['optimal_high'] < value <= pattern['warning_high']):
-                status_icon = "🟡"
-            else:
-                status_icon = "🔴"
-            
-            output += f"{status_icon} {param_name}: {value:.1f} {config['unit']}\n"
-        
+        parts.append(f"\n📊 CURRENT SENSOR READINGS\n{_DASH40}\n")
+        param_names = self._param_order
+        status_icons = ("🟢", "🟡", "🔴")
+        codes = self._classify(current_values)
+        for param_name, value, code, unit in zip(param_names, current_values, codes, self._param_units):
+            parts.append(f"{status_icons[code]} {param_name}: {value:.1f} {unit}\n")
+
         # Failure predictions
-        output += f"\n⚠️ FAILURE PREDICTIONS\n"
-        output += f"{'-'*40}\n"
-        for i, (param_name, failure_prob) in enumerate(zip(param_names, result['failure_predictions'])):
+        parts.append(f"\n⚠️ FAILURE PREDICTIONS\n{_DASH40}\n")
+        for param_name, failure_prob in zip(param_names, result['failure_predictions']):
             if failure_prob > 0.4:  # Only show significant risks (increased from 0.3)
                 risk_level = "HIGH" if failure_prob > 0.7 else "MEDIUM"
-                output += f"🔴 {param_name}: {failure_prob:.1%} ({risk_level} RISK)\n"
+                parts.append(f"🔴 {param_name}: {failure_prob:.1%} ({risk_level} RISK)\n")
             else:
-                output += f"🟢 {param_name}: {failure_prob:.1%} (LOW RISK)\n"
-        
+                parts.append(f"🟢 {param_name}: {failure_prob:.1%} (LOW RISK)\n")
+
         # Buffer status
-        buffer_size = len(self.sensor_history)
-        output += f"\n📈 DATA BUFFER STATUS\n"
-        output += f"{'-'*40}\n"
-        output += f"Buffer: {buffer_size}/{self.sequence_length} points\n"
+        buffer_size = min(self._hist_count, self.sequence_length)
+        parts.append(
+            f"\n📈 DATA BUFFER STATUS\n{_DASH40}\n"
+            f"Buffer: {buffer_size}/{self.sequence_length} points\n"
+        )
         if buffer_size >= self.sequence_length:
-            output += f"✅ Full buffer - Enhanced predictions active\n"
+            parts.append("✅ Full buffer - Enhanced predictions active\n")
         else:
-            output += f"⏳ Building buffer for optimal predictions...\n"
-        
-        output += f"\n{'='*60}\n"
-        output += f"⏱️ Next update in 3 seconds...\n"
-        
-        self.analysis_display.insert(tk.END, output)
-        self.analysis_display.see(tk.END)
+            parts.append("⏳ Building buffer for optimal predictions...\n")
+
+        parts.append(f"\n{_EQ60}\n⏱️ Next update in 3 seconds...\n")
+
+        self.log("".join(parts))
         
         # Update maintenance panels
         failure_analysis = self.analyze_failure_reasons(current_values, result['failure_predictions'])
@@ -1172,129 +1636,145 @@ class EnhancedPredictiveMonitor:
         self.update_failure_display(failure_analysis)
         self.update_maintenance_display(recommendations)
     
+    def log(self, msg):
+        """Queue text for the analysis display; writes are flushed once per idle cycle"""
+        self._analysis_queue.append(msg)
+        if not self._analysis_flush_scheduled:
+            self._analysis_flush_scheduled = True
+            self.root.after_idle(self._flush_analysis)
+
+    def _flush_analysis(self):
+        """Write all queued analysis text in one enable/insert/disable pass"""
+        self._analysis_flush_scheduled = False
+        if not self._analysis_queue:
+            return
+        self.analysis_display.configure(state='normal')
+        self.analysis_display.insert(tk.END, "".join(self._analysis_queue))
+        self._analysis_queue.clear()
+        self._trim_log(self.analysis_display)
+        self.analysis_display.configure(state='disabled')
+        self.analysis_display.see(tk.END)
+
+    def _trim_log(self, widget):
+        """Drop oldest lines once a Text widget exceeds the log line cap"""
+        line_count = int(widget.index('end-1c').split('.')[0])
+        overflow = line_count - self._max_log_lines
+        if overflow > 0:
+            widget.delete('1.0', f'{overflow + 1}.0')
+
+    def _now_str(self):
+        """Wall-clock 'YYYY-mm-dd HH:MM:SS', reformatted at most once a second"""
+        now = time.time()
+        if now - self._now_stamp >= 1.0:
+            self._now_stamp = now
+            self._now_text = time.strftime('%Y-%m-%d %H:%M:%S')
+        return self._now_text
+
+    def _set_panel_text(self, widget, key, text):
+        """Rewrite a read-only panel only when its content actually changed"""
+        if self._panel_cache.get(key) == text:
+            return
+        self._panel_cache[key] = text
+        widget.config(state='normal')
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, text)
+        widget.config(state='disabled')
+
     def update_health_summary(self, current_values):
         """Update parameter health summary"""
-        self.health_summary.config(state='normal')
-        self.health_summary.delete(1.0, tk.END)
-        
-        param_names = list(self.parameters.keys())
-        healthy_count = 0
-        warning_count = 0
-        critical_count = 0
-        
-        summary_text = "📊 PARAMETER HEALTH OVERVIEW\n"
-        summary_text += "=" * 35 + "\n\n"
-        
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            pattern = self.failure_patterns[param_name]
-            config = self.parameters[param_name]
-            
-            # CORRECTED LOGIC - same as update_value_label
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status = "OPTIMAL"
-                icon = "🟢"
-                healthy_count += 1
-            elif (pattern['warning_low'] <= value < pattern['optimal_low']) or (pattern['optimal_high'] < value <= pattern['warning_high']):
-                status = "WARNING"
-                icon = "🟡"
-                warning_count += 1
-            else:
-                status = "CRITICAL"
-                icon = "🔴"
-                critical_count += 1
-            
-            summary_text += f"{icon} {param_name.replace('_', ' ')}\n"
-            summary_text += f"   Value: {value:.1f} {config['unit']}\n"
-            summary_text += f"   Status: {status}\n"
-            summary_text += f"   Optimal: {pattern['optimal_low']}-{pattern['optimal_high']}\n\n"
-        
+        if self.health_summary is None:
+            return
+
+        param_names = self._param_order
+
+        parts = [f"📊 PARAMETER HEALTH OVERVIEW\n{_EQ35}\n\n"]
+
+        # One vectorized classification covers the rows and the tallies
+        codes = self._classify(current_values)
+        healthy_count = int((codes == 0).sum())
+        warning_count = int((codes == 1).sum())
+        critical_count = int((codes == 2).sum())
+        status_names = ("OPTIMAL", "WARNING", "CRITICAL")
+        status_icons = ("🟢", "🟡", "🔴")
+        for i, (param_name, value, code) in enumerate(zip(param_names, current_values, codes)):
+            row = self.P[i]
+            parts.append(
+                f"{status_icons[code]} {param_name.replace('_', ' ')}\n"
+                f"   Value: {value:.1f} {self._param_units[i]}\n"
+                f"   Status: {status_names[code]}\n"
+                f"   Optimal: {row['ol']:g}-{row['oh']:g}\n\n"
+            )
+
         # Summary statistics
-        summary_text += f"📈 SUMMARY\n"
-        summary_text += f"-" * 20 + "\n"
-        summary_text += f"🟢 Optimal: {healthy_count}/6\n"
-        summary_text += f"🟡 Warning: {warning_count}/6\n"
-        summary_text += f"🔴 Critical: {critical_count}/6\n"
-        
-        self.health_summary.insert(tk.END, summary_text)
-        self.health_summary.config(state='disabled')
-    
+        parts.append(
+            f"📈 SUMMARY\n{_DASH20}\n"
+            f"🟢 Optimal: {healthy_count}/6\n"
+            f"🟡 Warning: {warning_count}/6\n"
+            f"🔴 Critical: {critical_count}/6\n"
+        )
+
+        self._set_panel_text(self.health_summary, 'summary', "".join(parts))
+
     def update_failure_display(self, failure_analysis):
         """Update failure predictions display"""
-        self.failure_display.config(state='normal')
-        self.failure_display.delete(1.0, tk.END)
-        
-        failure_text = "⚠️ FAILURE ANALYSIS\n"
-        failure_text += "=" * 25 + "\n\n"
-        
+        if self.failure_display is None:
+            return
+
+        parts = [f"⚠️ FAILURE ANALYSIS\n{_EQ25}\n\n"]
+
         if not failure_analysis:
-            failure_text += "✅ No significant failure risks detected.\n"
-            failure_text += "All parameters within acceptable ranges.\n"
+            parts.append(
+                "✅ No significant failure risks detected.\n"
+                "All parameters within acceptable ranges.\n"
+            )
         else:
-            failure_text += f"🔍 {len(failure_analysis)} parameter(s) at risk:\n\n"
-            
+            parts.append(f"🔍 {len(failure_analysis)} parameter(s) at risk:\n\n")
+
             for analysis in failure_analysis:
-                severity_colors = {
-                    'HIGH': '🔴',
-                    'MEDIUM': '🟡', 
-                    'LOW': '🟠'
-                }
-                
-                icon = severity_colors.get(analysis['severity'], '⚠️')
-                failure_text += f"{icon} {analysis['parameter'].replace('_', ' ')}\n"
-                failure_text += f"   Value: {analysis['value']:.1f}\n"
-                failure_text += f"   Risk: {analysis['failure_probability']:.1%} ({analysis['severity']})\n"
-                failure_text += f"   Reason: {analysis['reason']}\n\n"
-                
-                icon = severity_colors.get(analysis['severity'], '⚠️')
-                failure_text += f"{icon} {analysis['parameter'].replace('_', ' ')}\n"
-                failure_text += f"   Risk: {analysis['failure_probability']:.1%}\n"
-                failure_text += f"   Severity: {analysis['severity']}\n"
-                failure_text += f"   Current: {analysis['value']:.1f}\n"
-                failure_text += f"   Reason: {analysis['reason']}\n\n"
-        
-        self.failure_display.insert(tk.END, failure_text)
-        self.failure_display.config(state='disabled')
-    
+                icon = _SEVERITY_ICONS.get(analysis['severity'], '⚠️')
+                parts.append(
+                    f"{icon} {analysis['parameter'].replace('_', ' ')}\n"
+                    f"   Value: {analysis['value']:.1f}\n"
+                    f"   Risk: {analysis['failure_probability']:.1%} ({analysis['severity']})\n"
+                    f"   Reason: {analysis['reason']}\n\n"
+                )
+
+        self._set_panel_text(self.failure_display, 'failure', "".join(parts))
+
     def update_maintenance_display(self, recommendations):
         """Update maintenance recommendations display"""
-        self.maintenance_display.config(state='normal')
-        self.maintenance_display.delete(1.0, tk.END)
-        
-        maint_text = "🔧 MAINTENANCE SCHEDULE\n"
-        maint_text += "=" * 30 + "\n\n"
-        
+        if self.maintenance_display is None:
+            return
+
+        parts = [f"🔧 MAINTENANCE SCHEDULE\n{_EQ30}\n\n"]
+
         # Sort by priority
-        priority_order = {'URGENT': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 4))
-        
+        recommendations.sort(key=lambda x: _PRIORITY_ORDER.get(x['priority'], 4))
+
         for i, rec in enumerate(recommendations, 1):
-            priority_icons = {
-                'URGENT': '🚨',
-                'HIGH': '🔴',
-                'MEDIUM': '🟡',
-                'LOW': '🟢'
-            }
-            
-            icon = priority_icons.get(rec['priority'], '📋')
-            maint_text += f"{i}. {icon} {rec['action']}\n"
-            maint_text += f"   Priority: {rec['priority']}\n"
-            maint_text += f"   Timeline: {rec['timeline']}\n"
-            maint_text += f"   Description: {rec['description']}\n\n"
-        
+            icon = _PRIORITY_ICONS.get(rec['priority'], '📋')
+            parts.append(
+                f"{i}. {icon} {rec['action']}\n"
+                f"   Priority: {rec['priority']}\n"
+                f"   Timeline: {rec['timeline']}\n"
+                f"   Description: {rec['description']}\n\n"
+            )
+
         # Add general recommendations
-        maint_text += "💡 GENERAL RECOMMENDATIONS\n"
-        maint_text += "-" * 25 + "\n"
-        maint_text += "• Monitor critical parameters closely\n"
-        maint_text += "• Document all maintenance activities\n"
-        maint_text += "• Keep spare parts inventory updated\n"
-        maint_text += "• Train operators on early warning signs\n"
-        
-        self.maintenance_display.insert(tk.END, maint_text)
-        self.maintenance_display.config(state='disabled')
+        parts.append(
+            f"💡 GENERAL RECOMMENDATIONS\n{_DASH25}\n"
+            "• Monitor critical parameters closely\n"
+            "• Document all maintenance activities\n"
+            "• Keep spare parts inventory updated\n"
+            "• Train operators on early warning signs\n"
+        )
+
+        self._set_panel_text(self.maintenance_display, 'maintenance', "".join(parts))
     
     def start_monitoring(self):
         """Start the enhanced monitoring process"""
         self.is_monitoring = True
+        self._stop_event.clear()
         self.recording_start_time = time.time()
         self.data_points_recorded = 0
         
@@ -1303,37 +1783,44 @@ class EnhancedPredictiveMonitor:
         self.stop_button.config(state='normal')
         
         # Clear history
-        self.sensor_history.clear()
+        self._hist_idx = 0
+        self._hist_count = 0
         self.timestamps.clear()
         
         # Start monitoring thread
         self.monitoring_thread = threading.Thread(target=self.monitoring_loop, daemon=True)
         self.monitoring_thread.start()
         
-        self.main_status_label.config(text="🔄 MONITORING ACTIVE", fg='#3498db')
+        self.status_var.set("🔄 MONITORING ACTIVE")
+        self.main_status_label.config(fg='#3498db')
     
     def stop_monitoring(self):
         """Stop the monitoring process"""
         self.is_monitoring = False
-        
+        self._stop_event.set()
+
         # Update buttons
         self.start_button.config(state='normal')
         self.stop_button.config(state='disabled')
         
-        self.main_status_label.config(text="⏹️ MONITORING STOPPED", fg='#95a5a6')
+        self.status_var.set("⏹️ MONITORING STOPPED")
+        self.main_status_label.config(fg='#95a5a6')
     
     def reset_system(self):
         """Reset the entire system"""
         self.is_monitoring = False
+        self._stop_event.set()
         self.recording_start_time = None
         self.data_points_recorded = 0
         
         # Clear all data
-        self.sensor_history.clear()
+        self._hist_idx = 0
+        self._hist_count = 0
         self.timestamps.clear()
-        
+        self._pred_cache.clear()
+
         # Clear active alerts
-        self.active_alerts.clear()
+        self._alerts_mask = 0
         # Close any open alert windows
         for alert_window in list(self.alert_windows.values()):
             try:
@@ -1346,22 +1833,31 @@ class EnhancedPredictiveMonitor:
         self.alert_cooldown_until = 0
         print("🔄 System reset - alert cooldown cleared")
         
-        # Reset GUI elements
-        self.main_status_label.config(text="🟢 SYSTEM READY", fg='#27ae60')
-        self.confidence_label.config(text="Confidence: N/A")
-        self.ttf_label.config(text="Time to Failure: N/A")
+        # Reset GUI elements (and the change-skip caches that track them)
+        self._last_main_status = None
+        self._last_conf_text = None
+        self._last_ttf = None
+        self.status_var.set("🟢 SYSTEM READY")
+        self.main_status_label.config(fg='#27ae60')
+        self.confidence_var.set("Confidence: N/A")
+        self.ttf_var.set("Time to Failure: N/A")
         
         # Clear displays
+        self._panel_cache.clear()
+        self._analysis_queue.clear()
+        self.analysis_display.configure(state='normal')
         self.analysis_display.delete(1.0, tk.END)
-        self.health_summary.config(state='normal')
-        self.health_summary.delete(1.0, tk.END)
-        self.health_summary.config(state='disabled')
-        self.failure_display.config(state='normal')
-        self.failure_display.delete(1.0, tk.END)
-        self.failure_display.config(state='disabled')
-        self.maintenance_display.config(state='normal')
-        self.maintenance_display.delete(1.0, tk.END)
-        self.maintenance_display.config(state='disabled')
+        self.analysis_display.configure(state='disabled')
+        if self.health_summary is not None:
+            self.health_summary.config(state='normal')
+            self.health_summary.delete(1.0, tk.END)
+            self.health_summary.config(state='disabled')
+            self.failure_display.config(state='normal')
+            self.failure_display.delete(1.0, tk.END)
+            self.failure_display.config(state='disabled')
+            self.maintenance_display.config(state='normal')
+            self.maintenance_display.delete(1.0, tk.END)
+            self.maintenance_display.config(state='disabled')
         
         # Reset sliders to defaults
         for param_name, config in self.parameters.items():
@@ -1381,12 +1877,18 @@ class EnhancedPredictiveMonitor:
 
 🎯 Click 'START MONITORING' to begin analysis
 """
-        self.analysis_display.insert(tk.END, initial_msg)
+        self.log(initial_msg)
     
     def monitoring_loop(self):
         """Enhanced monitoring loop with predictive analytics - OPTIMIZED for faster response"""
         print("🚀 Starting OPTIMIZED monitoring loop with instant predictions...")
         
+        # Drift-corrected 1 Hz scheduler: each tick targets an absolute
+        # monotonic deadline instead of sleep(1), so inference latency or GC
+        # pauses don't accumulate into wall-clock drift
+        tick_ns = 1_000_000_000
+        next_tick = time.monotonic_ns()
+        
         while self.is_monitoring:
             try:
                 # ✅ REDUCED DELAY: Faster background monitoring (1 second instead of 3)
@@ -1395,43 +1897,39 @@ class EnhancedPredictiveMonitor:
                 
                 # Get current sensor values
                 current_values = self.get_current_values()
-                current_time = datetime.now()
+                current_time = time.monotonic()
                 
                 # Add to history (this might be duplicate from immediate predictions, but that's OK)
-                self.sensor_history.append(current_values)
+                self._append_sample(current_values)
                 self.timestamps.append(current_time)
                 
-                # Keep only required sequence length
-                if len(self.sensor_history) > self.sequence_length:
-                    self.sensor_history = self.sensor_history[-self.sequence_length:]
-                    self.timestamps = self.timestamps[-self.sequence_length:]
-                
-                # Background prediction (less frequent since immediate predictions handle real-time)
-                result = self.predict_health(self.sensor_history)
-                
-                if result:
-                    # Update GUI in main thread (background update)
-                    self.root.after(0, self.update_displays, result, current_values)
-                    
-                    # Update timer
+                # Background prediction via the shared inference worker -
+                # rendering and alert checks happen in _apply_prediction.
+                # During warmup the window would only be padding, so skip
+                # inference and just keep the timer showing buffer fill
+                if self._hist_count >= self.sequence_length:
+                    self._submit_inference(self._last_sequence(), current_values)
+                else:
                     self.root.after(0, self.update_timer)
-                    
-                    # Background alert check (immediate alerts are handled by trigger_immediate_prediction)
-                    # Only show background alerts if no immediate alerts were triggered
-                    if result['predicted_status'] == 'CRITICAL':
-                        self.root.after(0, self.emergency_alert, result)
-                    elif result['predicted_status'] == 'WARNING' and result['confidence'] > 0.6:
-                        self.root.after(0, self.emergency_alert, result)
-                
+
                 self.data_points_recorded += 1
                 
-                # ✅ FASTER LOOP: Reduced from 3 seconds to 1 second for better responsiveness
-                # Immediate predictions handle real-time changes, this just provides background monitoring
-                time.sleep(1)
-                
+                # Wait only until the next absolute deadline; the stop event
+                # interrupts immediately. If a tick overran, rebase instead
+                # of bursting to catch up
+                next_tick += tick_ns
+                dt = (next_tick - time.monotonic_ns()) / 1e9
+                if dt > 0:
+                    if self._stop_event.wait(dt):
+                        break
+                else:
+                    next_tick = time.monotonic_ns()
+
             except Exception as e:
                 print(f"❌ Monitoring error: {e}")
-                time.sleep(1)  # Continue monitoring even if error occurs
+                next_tick = time.monotonic_ns() + tick_ns
+                if self._stop_event.wait(1.0):  # Continue monitoring unless stopped
+                    break
     
     def update_timer(self):
         """Update the timer display"""
@@ -1440,43 +1938,67 @@ class EnhancedPredictiveMonitor:
             minutes = int(elapsed_time // 60)
             seconds = int(elapsed_time % 60)
             
-            buffer_size = len(self.sensor_history)
+            buffer_size = min(self._hist_count, self.sequence_length)
             timer_text = f"⏱️ Timer: {minutes:02d}:{seconds:02d} | Points: {self.data_points_recorded} | Buffer: {buffer_size}/{self.sequence_length}"
-            self.timer_label.config(text=timer_text)
+            self.timer_var.set(timer_text)
     
     def emergency_alert(self, result):
         """Show emergency alert for critical conditions in separate window"""
         # ✅ CHECK COOLDOWN: Prevent alert spam with 5-second delay
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time < self.alert_cooldown_until:
             remaining_time = int(self.alert_cooldown_until - current_time)
-            print(f"⏰ Alert suppressed - cooldown active for {remaining_time} more second(s)")
+            _log.debug("⏰ Alert suppressed - cooldown active for %d more second(s)", remaining_time)
             return  # Don't show alert during cooldown period
         
         # Generate unique alert ID based on status and critical parameters
-        critical_params = []
-        param_names = list(self.parameters.keys())
+        # ✅ UPDATED: Any parameter outside optimal range is critical - one
+        # vectorized mask instead of per-parameter pattern lookups
+        param_names = self._param_order
         current_values = self.get_current_values()
+        vals = np.asarray(current_values, dtype=np.float32)
+        outside = (vals < self.P['ol']) | (vals > self.P['oh'])
+        critical_params = [param_names[i] for i in np.nonzero(outside)[0]]
         
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            pattern = self.failure_patterns[param_name]
-            # ✅ UPDATED: Any parameter outside optimal range is critical
-            if not (pattern['optimal_low'] <= value <= pattern['optimal_high']):
-                critical_params.append(param_name)
-        
-        alert_id = f"{result['predicted_status']}_{'-'.join(sorted(critical_params))}"
-        
+        status = result['predicted_status']
+        alert_id = self._alert_bits[('_overall', status)]
+        for param_name in critical_params:
+            alert_id |= self._alert_bits[(param_name, status)]
+
         # Check if this alert is already being shown
-        if alert_id in self.active_alerts:
+        if (self._alerts_mask & alert_id) == alert_id:
             return  # Don't create duplicate alerts
-        
+
         # Add to active alerts
-        self.active_alerts.add(alert_id)
-        
-        # Create separate alert window
-        self.create_alert_window(result, critical_params, alert_id)
-    
-    def create_alert_window(self, result, critical_params, alert_id):
+        self._alerts_mask |= alert_id
+
+        # WARNING shows the reusable in-panel banner; only CRITICAL opens a window
+        if result['predicted_status'] == 'WARNING':
+            self._show_warning_banner(result, alert_id)
+            return
+
+        # Create separate alert window with the same slider snapshot the
+        # critical-parameter mask was computed from
+        self.create_alert_window(result, critical_params, alert_id, current_values)
+
+    def _show_warning_banner(self, result, alert_id):
+        """Show the warning banner in the status panel"""
+        self.warning_banner_label.configure(
+            text=f"⚠️ WARNING: confidence {result['confidence']:.1%} - "
+                 f"estimated time to failure {result['time_to_failure']:.1f} hours"
+        )
+        self._warning_alert_id = alert_id
+        self.warning_banner.pack(fill='x', padx=15, pady=(10, 0), before=self._status_frame)
+
+    def _dismiss_warning_banner(self):
+        """Hide the warning banner and start the alert cooldown"""
+        self.warning_banner.pack_forget()
+        self.alert_cooldown_until = time.monotonic() + 5.0
+        if self._warning_alert_id is not None:
+            self._alerts_mask &= ~self._warning_alert_id
+            self._warning_alert_id = None
+
+    def create_alert_window(self, result, critical_params, alert_id, current_values):
         """Create a separate alert window for warnings/critical alerts"""
         # Create new top-level window
         alert_window = tk.Toplevel(self.root)
@@ -1493,12 +2015,12 @@ class EnhancedPredictiveMonitor:
         
         # Configure window close behavior
         def on_alert_close():
-            self.active_alerts.discard(alert_id)
+            self._alerts_mask &= ~alert_id
             if alert_id in self.alert_windows:
                 del self.alert_windows[alert_id]
             
             # ✅ SET COOLDOWN: 5-second delay before next alert can appear
-            self.alert_cooldown_until = time.time() + 5.0  # 5 seconds from now
+            self.alert_cooldown_until = time.monotonic() + 5.0  # 5 seconds from now
             print(f"🔄 Alert closed - 5-second cooldown activated until next alert")
             
             alert_window.destroy()
@@ -1506,12 +2028,9 @@ class EnhancedPredictiveMonitor:
         alert_window.protocol("WM_DELETE_WINDOW", on_alert_close)
         
         # Alert header
-        status_colors = {'CRITICAL': '#e74c3c', 'WARNING': '#f39c12'}
-        status_icons = {'CRITICAL': '🚨', 'WARNING': '⚠️'}
-        
         status = result['predicted_status']
-        color = status_colors.get(status, '#f39c12')
-        icon = status_icons.get(status, '⚠️')
+        color = _STATUS_COLORS.get(status, '#f39c12')
+        icon = '🚨' if status == 'CRITICAL' else '⚠️'
         
         header_frame = tk.Frame(alert_window, bg=color, height=80)
         header_frame.pack(fill='x')
@@ -1553,22 +2072,15 @@ class EnhancedPredictiveMonitor:
         canvas.pack(side="left", fill="both", expand=True)
         content_scrollbar.pack(side="right", fill="y")
         
-        # Enhanced mousewheel binding for alert window
+        # Wheel events bound straight on the alert canvas - same direct
+        # binding as the control panel, no bind_all churn
         def _on_alert_mousewheel(event):
-            if canvas.winfo_containing(event.x_root, event.y_root) == canvas:
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _bind_alert_mousewheel(event):
-            alert_window.bind_all("<MouseWheel>", _on_alert_mousewheel)
-        
-        def _unbind_alert_mousewheel(event):
-            alert_window.unbind_all("<MouseWheel>")
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
         
-        # Bind mouse wheel only when hovering over alert content
-        canvas.bind('<Enter>', _bind_alert_mousewheel)
-        canvas.bind('<Leave>', _unbind_alert_mousewheel)
-        scrollable_content.bind('<Enter>', _bind_alert_mousewheel)
-        scrollable_content.bind('<Leave>', _unbind_alert_mousewheel)
+        canvas.bind("<MouseWheel>", _on_alert_mousewheel)
+        scrollable_content.bind("<MouseWheel>", _on_alert_mousewheel)
+        canvas.bind("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+        canvas.bind("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
         
         # Add scroll indicator to alert
         scroll_indicator = tk.Label(
@@ -1579,37 +2091,34 @@ class EnhancedPredictiveMonitor:
         )
         scroll_indicator.pack(pady=(5, 0))
         
-        # Alert details in scrollable content
-        details_text = f"⏰ Time: {result['timestamp'].strftime('%H:%M:%S')}\n"
-        details_text += f"🎯 Confidence: {result['confidence']:.1%}\n"
-        details_text += f"⚡ Time to Failure: {result['time_to_failure']:.1f} hours\n\n"
-        
+        # Alert details in scrollable content - the snapshot passed in from
+        # emergency_alert and one vectorized classification cover both sections
+        codes = self._classify(current_values)
+        status_icons = ("🟢", "🟡", "🔴")
+        status_names = ("OPTIMAL", "WARNING", "CRITICAL")
+
+        details = [
+            f"⏰ Time: {self._now_str()[11:]}\n"
+            f"🎯 Confidence: {result['confidence']:.1%}\n"
+            f"⚡ Time to Failure: {result['time_to_failure']:.1f} hours\n\n"
+        ]
+
         if critical_params:
-            details_text += f"🔴 Critical Parameters:\n"
+            details.append(f"🔴 Critical Parameters:\n")
             for param in critical_params:
-                current_value = self.get_current_values()[list(self.parameters.keys()).index(param)]
-                details_text += f"   • {param.replace('_', ' ')}: {current_value:.1f}\n"
-            details_text += "\n"
-        
+                current_value = current_values[self._param_idx[param]]
+                details.append(f"   • {param.replace('_', ' ')}: {current_value:.1f}\n")
+            details.append("\n")
+
         # Add parameter status overview
-        details_text += f"📊 All Parameter Status:\n"
-        param_names = list(self.parameters.keys())
-        current_values = self.get_current_values()
-        for i, (param_name, value) in enumerate(zip(param_names, current_values)):
-            pattern = self.failure_patterns[param_name]
-            config = self.parameters[param_name]
-            
-            if pattern['optimal_low'] <= value <= pattern['optimal_high']:
-                status_icon = "🟢"
-                status_text = "OPTIMAL"
-            elif pattern['warning_low'] <= value <= pattern['warning_high']:
-                status_icon = "🟡"
-                status_text = "WARNING"
-            else:
-                status_icon = "🔴"
-                status_text = "CRITICAL"
-            
-            details_text += f"   {status_icon} {param_name.replace('_', ' ')}: {value:.1f} {config['unit']} ({status_text})\n"
+        details.append(f"📊 All Parameter Status:\n")
+        for param_name, value, code, unit in zip(self._param_order, current_values,
+                                                 codes, self._param_units):
+            details.append(
+                f"   {status_icons[code]} {param_name.replace('_', ' ')}: "
+                f"{value:.1f} {unit} ({status_names[code]})\n"
+            )
+        details_text = "".join(details)
         
         details_label = tk.Label(
             scrollable_content, 
@@ -1688,28 +2197,28 @@ class EnhancedPredictiveMonitor:
             )
             stop_button.pack(side='left')
         
-        # Make window modal
-        alert_window.grab_set()
+        # Kept non-modal on purpose: no grab_set, so the main event loop
+        # keeps servicing the monitoring thread's after-callbacks
         alert_window.focus_set()
-        
-        # Auto-close after 5 minutes for warnings
-        if status == 'WARNING':
-            alert_window.after(300000, on_alert_close)  # 5 minutes
     
+    def _clear_alert_bits(self, alert_id):
+        """Drop an alert's bits from the active-alerts mask"""
+        self._alerts_mask &= ~alert_id
+
     def snooze_alert(self, alert_id, close_callback):
         """Snooze alert for 5 minutes"""
         # Remove from active alerts temporarily
-        self.active_alerts.discard(alert_id)
+        self._alerts_mask &= ~alert_id
         
         # ✅ SET COOLDOWN: 5-second delay before next alert can appear
-        self.alert_cooldown_until = time.time() + 5.0  # 5 seconds from now
+        self.alert_cooldown_until = time.monotonic() + 5.0  # 5 seconds from now
         print(f"⏰ Alert snoozed - 5-second cooldown activated until next alert")
         
         # Close the window
         close_callback()
         
         # Schedule re-activation after 5 minutes (300 seconds)
-        self.root.after(300000, lambda: self.active_alerts.discard(alert_id))
+        self.root.after(300000, lambda: self._clear_alert_bits(alert_id))
         
         # Show confirmation
         messagebox.showinfo("Alert Snoozed", "⏰ Alert snoozed for 5 minutes")
@@ -1719,16 +2228,18 @@ class EnhancedPredictiveMonitor:
         self.stop_monitoring()
         
         # ✅ SET COOLDOWN: 5-second delay before next alert can appear
-        self.alert_cooldown_until = time.time() + 5.0  # 5 seconds from now
+        self.alert_cooldown_until = time.monotonic() + 5.0  # 5 seconds from now
         print(f"🛑 Emergency stop activated - 5-second cooldown activated until next alert")
         
         close_callback()
-        
-        # Show confirmation
-        messagebox.showinfo(
-            "Emergency Stop Activated",
-            "🛑 Monitoring has been stopped.\n\nSystem is now in safe mode.\nContact maintenance before restarting."
+
+        # Show confirmation - non-modal, so the main loop keeps draining
+        # after-callbacks instead of freezing in a nested messagebox loop
+        self._estop_label.configure(
+            text="🛑 Monitoring has been stopped.\n\nSystem is now in safe mode.\nContact maintenance before restarting."
         )
+        self._estop_dialog.deiconify()
+        self._estop_dialog.lift()
     
     def run(self):
         """Start the application"""
@@ -1736,6 +2247,10 @@ class EnhancedPredictiveMonitor:
 
 def main():
     """Main function"""
+    logging.basicConfig(
+        level=logging.DEBUG if '--debug' in sys.argv else logging.WARNING,
+        format='%(message)s'
+    )
     print("Starting Enhanced Predictive Maintenance Monitor...")
     
     app = EnhancedPredictiveMonitor()
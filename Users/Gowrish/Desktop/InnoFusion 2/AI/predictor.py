@@ -0,0 +1,335 @@
+"""
+Numeric prediction core for the enhanced monitor.
+
+Everything in here is plain NumPy/Numba with no Tkinter imports, so the
+predictor thread runs with no GUI code in its call graph and the same
+logic can be reused or exercised headlessly. The GUI composes a
+Predictor and hands it current values; model loading and inference stay
+with the caller, which falls back to simulate() when no model is ready.
+"""
+
+import numpy as np
+
+# Optional Numba import - JIT-compiles the per-tick classification kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernels below stay plain Python without Numba"""
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Health class index -> status name (avoids rebuilding a dict per prediction)
+STATUS = ("HEALTHY", "WARNING", "CRITICAL")
+
+# Per-parameter level names indexed by the codes from status_codes
+LEVELS = ("OPTIMAL", "WARNING", "CRITICAL")
+
+# Failure severity names indexed by the codes from analyze
+SEVERITY = ("HIGH", "MEDIUM", "LOW")
+
+
+@njit(cache=True)
+def _classify_levels(values, crit_lo, crit_hi, warn_lo, warn_hi, opt_lo, opt_hi, fail_out):
+    """Classify all parameters and derive the overall verdict in one native call.
+
+    Fills fail_out with per-parameter failure probabilities and returns
+    (health_class, critical_count, warning_count, confidence, max_failure_prob).
+    """
+    n_crit = 0
+    n_warn = 0
+    any_risk = False
+    max_fp = 0.0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v <= crit_lo[i] or v >= crit_hi[i]:
+            p = 0.9
+            n_crit += 1
+        elif v <= warn_lo[i] or v >= warn_hi[i]:
+            p = 0.6
+            n_warn += 1
+        elif opt_lo[i] <= v <= opt_hi[i]:
+            p = 0.05
+        else:
+            p = 0.2
+        fail_out[i] = p
+        if p > 0.3:
+            any_risk = True
+        if p > max_fp:
+            max_fp = p
+    if n_crit > 0:
+        health_class = 2
+        confidence = 0.85 + n_crit * 0.05
+    elif n_warn > 0 or any_risk:
+        health_class = 1
+        confidence = 0.75 + n_warn * 0.05
+    else:
+        health_class = 0
+        confidence = 0.95
+    return health_class, n_crit, n_warn, confidence, max_fp
+
+
+@njit(cache=True)
+def classify_one(val, opt_lo, opt_hi, warn_lo, warn_hi):
+    """Scalar status for one parameter: 0=optimal, 1=warning, 2=critical"""
+    if opt_lo <= val <= opt_hi:
+        return 0
+    if warn_lo <= val <= warn_hi:
+        return 1
+    return 2
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT cache at import so the first slider move / tick pays no compile cost
+    _warm = np.zeros(1, dtype=np.float32)
+    _classify_levels(_warm, _warm, _warm, _warm, _warm, _warm, _warm, np.empty(1, dtype=np.float32))
+    classify_one(0.0, 0.0, 0.0, 0.0, 0.0)
+    del _warm
+
+
+class Predictor:
+    """Classification, simulation, failure analysis and recommendations.
+
+    Takes the same parameters/failure_patterns dicts the monitor builds
+    and precomputes every threshold as a float32 array in parameter order
+    so the per-tick calls are vectorized lookups rather than dict walks.
+    """
+
+    def __init__(self, parameters, failure_patterns):
+        self.parameters = parameters
+        self.failure_patterns = failure_patterns
+        self.param_names = tuple(parameters.keys())
+
+        # Threshold arrays in parameter order for vectorized classification
+        patterns = [failure_patterns[p] for p in parameters]
+        self.crit_lo = np.array([p['critical_low'] for p in patterns], dtype=np.float32)
+        self.crit_hi = np.array([p['critical_high'] for p in patterns], dtype=np.float32)
+        self.warn_lo = np.array([p['warning_low'] for p in patterns], dtype=np.float32)
+        self.warn_hi = np.array([p['warning_high'] for p in patterns], dtype=np.float32)
+        self.opt_lo = np.array([p['optimal_low'] for p in patterns], dtype=np.float32)
+        self.opt_hi = np.array([p['optimal_high'] for p in patterns], dtype=np.float32)
+
+        # TTF draw bounds - rows 0-2 baseline by health class (healthy,
+        # warning, critical), rows 3-5 urgency overrides by risk bucket
+        self._ttf_lo = np.array([80, 12, 2, 24, 8, 1], dtype=np.float32)
+        self._ttf_hi = np.array([150, 48, 8, 72, 24, 6], dtype=np.float32)
+        self._ttf_cuts = np.array([0.3, 0.5, 0.8], dtype=np.float32)
+
+        self._priority_order = {'URGENT': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3}
+
+        # Parameter -> recommendation factory; extend here for new parameters
+        self._rec_factories = {
+            'Temperature': self._rec_temperature,
+            'Fan_Speed': self._rec_fan_speed,
+            'Air_Flow_Rate': self._rec_airflow,
+        }
+
+        # Process-local RNG - no global legacy-RNG lock between threads
+        self._rng = np.random.default_rng()
+
+    def status_codes(self, cv):
+        """Vectorized per-parameter status: 0=optimal, 1=warning, 2=critical"""
+        optimal_mask = (cv >= self.opt_lo) & (cv <= self.opt_hi)
+        warning_mask = ~optimal_mask & (cv >= self.warn_lo) & (cv <= self.warn_hi)
+        return np.where(optimal_mask, 0, np.where(warning_mask, 1, 2))
+
+    def simulate(self, current_values, timestamp):
+        """Simulate enhanced prediction when model unavailable"""
+        param_names = self.param_names
+
+        values = np.asarray(current_values, dtype=np.float32)
+        if NUMBA_AVAILABLE:
+            # Compiled kernel: classification plus overall verdict in one call
+            failure_predictions = np.empty(len(values), dtype=np.float32)
+            health_class, critical_params, warning_params, confidence, max_failure_prob = \
+                _classify_levels(
+                    values, self.crit_lo, self.crit_hi, self.warn_lo, self.warn_hi,
+                    self.opt_lo, self.opt_hi, failure_predictions
+                )
+            issues = [param_names[i] for i in np.nonzero(failure_predictions >= 0.6)[0]]
+            status = STATUS[health_class]
+        else:
+            # Vectorized classification against the precomputed threshold arrays
+            crit_mask = (values <= self.crit_lo) | (values >= self.crit_hi)
+            warn_mask = ((values <= self.warn_lo) | (values >= self.warn_hi)) & ~crit_mask
+            opt_mask = (values >= self.opt_lo) & (values <= self.opt_hi)
+
+            failure_predictions = np.where(
+                crit_mask, 0.9, np.where(warn_mask, 0.6, np.where(opt_mask, 0.05, 0.2))
+            )
+            critical_params = int(crit_mask.sum())
+            warning_params = int(warn_mask.sum())
+            issues = [param_names[i] for i in np.nonzero(crit_mask | warn_mask)[0]]
+
+            # Determine overall health status based on parameter conditions
+            if critical_params > 0:
+                # Any critical parameter makes the system critical
+                status = "CRITICAL"
+                health_class = 2
+                confidence = 0.85 + (critical_params * 0.05)  # Higher confidence with more critical params
+            elif warning_params > 0 or bool((failure_predictions > 0.3).any()):
+                # Warning parameters or any significant failure risk
+                status = "WARNING"
+                health_class = 1
+                confidence = 0.75 + (warning_params * 0.05)
+            else:
+                # All parameters in good condition
+                status = "HEALTHY"
+                health_class = 0
+                confidence = 0.95
+            max_failure_prob = float(failure_predictions.max())
+
+        # One PRNG call covers the baseline draw and every urgency override
+        ttf_draws = self._rng.uniform(self._ttf_lo, self._ttf_hi)
+        ttf = float(ttf_draws[health_class])
+
+        # Adjust time to failure based on maximum failure probability -
+        # searchsorted picks the urgency bucket without an if/elif chain
+        bucket = int(np.searchsorted(self._ttf_cuts, max_failure_prob))
+        if bucket:
+            ttf = min(ttf, float(ttf_draws[2 + bucket]))
+
+        # Ensure confidence doesn't exceed 1.0
+        confidence = min(confidence, 1.0)
+
+        return {
+            'predicted_status': status,
+            'predicted_class': health_class,
+            'confidence': confidence,
+            'health_probabilities': [0.9, 0.1, 0.0] if health_class == 0 else
+                                   [0.2, 0.7, 0.1] if health_class == 1 else [0.1, 0.2, 0.7],
+            'failure_predictions': failure_predictions,
+            'time_to_failure': ttf,
+            'timestamp': timestamp,
+            'model_type': 'Simulation',
+            'issues': issues,
+            'critical_params': critical_params,
+            'warning_params': warning_params
+        }
+
+    def analyze(self, current_values, failure_predictions):
+        """Analyze specific failure reasons for each parameter"""
+        param_names = self.param_names
+        failure_analysis = []
+
+        failure_predictions = np.asarray(failure_predictions, dtype=np.float32)
+        at_risk = np.where(failure_predictions > 0.3)[0]  # Significant failure risk only
+        if not len(at_risk):
+            return failure_analysis
+
+        # One vectorized pass classifies severity for every parameter:
+        # beyond critical bounds -> HIGH, outside warning band -> MEDIUM
+        cv = np.asarray(current_values, dtype=np.float32)
+        low_mask = cv < self.warn_lo
+        high_mask = cv > self.warn_hi
+        critical_mask = (cv < self.crit_lo) | (cv > self.crit_hi)
+        severity_codes = np.where(critical_mask, 0, np.where(low_mask | high_mask, 1, 2))
+
+        for i in at_risk:
+            param_name = param_names[i]
+            pattern = self.failure_patterns[param_name]
+
+            if low_mask[i]:
+                reason = pattern['failure_reasons']['low']
+            elif high_mask[i]:
+                reason = pattern['failure_reasons']['high']
+            else:
+                reason = "Parameter trending towards failure range"
+
+            failure_analysis.append({
+                'parameter': param_name,
+                'value': current_values[i],
+                'failure_probability': float(failure_predictions[i]),
+                'severity': SEVERITY[severity_codes[i]],
+                'reason': reason
+            })
+
+        return failure_analysis
+
+    def recommend(self, result, failure_analysis):
+        """Generate specific maintenance recommendations"""
+        recommendations = []
+
+        # Time-based recommendations
+        ttf = result['time_to_failure']
+        if ttf < 8:  # Less than 8 hours
+            recommendations.append({
+                'priority': 'URGENT',
+                'action': 'Immediate System Shutdown',
+                'description': 'Critical failure predicted within 8 hours. Stop operations immediately.',
+                'timeline': 'NOW'
+            })
+        elif ttf < 24:  # Less than 24 hours
+            recommendations.append({
+                'priority': 'HIGH',
+                'action': 'Emergency Maintenance',
+                'description': 'Schedule emergency maintenance within the next shift.',
+                'timeline': 'Within 4 hours'
+            })
+        elif ttf < 72:  # Less than 3 days
+            recommendations.append({
+                'priority': 'MEDIUM',
+                'action': 'Planned Maintenance',
+                'description': 'Schedule maintenance within 48 hours to prevent failure.',
+                'timeline': 'Within 2 days'
+            })
+        else:
+            recommendations.append({
+                'priority': 'LOW',
+                'action': 'Routine Inspection',
+                'description': 'Continue normal operations with increased monitoring.',
+                'timeline': 'Next scheduled maintenance'
+            })
+
+        # Parameter-specific recommendations - O(1) factory dispatch instead
+        # of a string-comparison chain per entry
+        for analysis in failure_analysis:
+            factory = self._rec_factories.get(analysis['parameter'])
+            if factory:
+                recommendations.append(factory(analysis['value'], analysis['severity']))
+
+        # Integer sort key resolved once per entry, so the display sorts
+        # through a C itemgetter instead of a per-comparison dict lookup
+        for rec in recommendations:
+            rec['_pri'] = self._priority_order.get(rec['priority'], 4)
+
+        return recommendations
+
+    def _rec_temperature(self, value, severity):
+        """Temperature-specific maintenance recommendation"""
+        if value < 22:
+            return {
+                'priority': severity,
+                'action': 'Heating System Check',
+                'description': 'Inspect heating elements, temperature sensors, and control systems.',
+                'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
+            }
+        return {
+            'priority': severity,
+            'action': 'Cooling System Check',
+            'description': 'Inspect ventilation, fans, and temperature control systems.',
+            'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
+        }
+
+    def _rec_fan_speed(self, value, severity):
+        """Fan-speed-specific maintenance recommendation"""
+        return {
+            'priority': severity,
+            'action': 'Motor and Drive Inspection',
+            'description': 'Check motor bearings, belt tension, electrical connections, and drive system.',
+            'timeline': 'Next 12 hours' if severity == 'HIGH' else 'Next maintenance window'
+        }
+
+    def _rec_airflow(self, value, severity):
+        """Airflow-specific maintenance recommendation"""
+        return {
+            'priority': severity,
+            'action': 'Airflow System Maintenance',
+            'description': 'Clean air filters, check ductwork, inspect fan blades and housing.',
+            'timeline': 'Next 24 hours' if severity == 'HIGH' else 'Next maintenance window'
+        }